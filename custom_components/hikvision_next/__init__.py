@@ -18,11 +18,11 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, SECONDARY_COORDINATOR
 from .hikvision_device import HikvisionDevice
 from .isapi import ISAPIUnauthorizedError
-from .notifications import EventNotificationsView
-from .services import setup_services
+from .notifications import EventNotificationsView, cancel_entry_resets
+from .services import clear_device_cache, setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,10 +62,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: HikvisionConfigEntry) ->
         raise ConfigEntryNotReady(msg) from ex
 
     entry.runtime_data = device
+    entry.async_on_unload(lambda: clear_device_cache(entry.entry_id))
+    entry.async_on_unload(lambda: cancel_entry_resets(entry.entry_id))
+    entry.async_on_unload(device.aclose)
 
     await device.init_coordinators()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, get_device_platforms(device))
 
     device.pending_initialization = False
 
@@ -92,14 +95,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: HikvisionConfigEntry) -
     """Unload a config entry."""
 
     # Unload a config entry
+    device = entry.runtime_data
     unload_ok = all(
         await asyncio.gather(
-            *[hass.config_entries.async_forward_entry_unload(entry, platform) for platform in PLATFORMS]
+            *[
+                hass.config_entries.async_forward_entry_unload(entry, platform)
+                for platform in get_device_platforms(device)
+            ]
         )
     )
 
     # Reset alarm server after it has been set
-    device = entry.runtime_data
     if device.control_alarm_server_host:
         with suppress(Exception):
             await device.set_alarm_server("http://0.0.0.0:80", "/")
@@ -107,6 +113,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: HikvisionConfigEntry) -
     return unload_ok
 
 
+def get_device_platforms(device: HikvisionDevice) -> list[Platform]:
+    """Get platforms having entities for the device, so platforms without entities are not loaded."""
+    platforms = [Platform.BINARY_SENSOR, Platform.SWITCH]
+    if device.cameras:
+        platforms.extend((Platform.CAMERA, Platform.IMAGE))
+    if SECONDARY_COORDINATOR in device.coordinators:
+        platforms.append(Platform.SENSOR)
+    return [platform for platform in PLATFORMS if platform in platforms]
+
+
 def get_first_instance_unique_id(hass: HomeAssistant) -> int:
     """Get entry unique_id for first instance of integration."""
     entry = [entry for entry in hass.config_entries.async_entries(DOMAIN) if not entry.disabled_by][0]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from homeassistant.components.binary_sensor import ENTITY_ID_FORMAT, BinarySensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HikvisionConfigEntry
-from .const import EVENTS
+from .const import EVENTS, SIGNAL_EVENT_STATE
 from .hikvision_device import HikvisionDevice
 from .isapi import EventInfo
 from .isapi.const import EVENT_IO
@@ -52,3 +53,16 @@ class EventBinarySensor(BinarySensorEntity):
         self._attr_device_class = EVENTS[event.id]["device_class"]
         self._attr_device_info = device.hass_device_info(device_id)
         self._attr_entity_registry_enabled_default = not event.disabled
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates from event notifications."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_EVENT_STATE.format(self.unique_id), self._async_set_state)
+        )
+
+    @callback
+    def _async_set_state(self, is_on: bool) -> None:
+        """Set state received in event notification."""
+        self._attr_is_on = is_on
+        self.async_write_ha_state()
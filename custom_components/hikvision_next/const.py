@@ -1,5 +1,6 @@
 """hikvision integration constants."""
 
+from types import MappingProxyType
 from typing import Final
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -31,13 +32,15 @@ ACTION_PTZ_GOTO_PRESET = "ptz_goto_preset"
 ACTION_PTZ_SET_PATROL = "ptz_set_patrol"
 
 HIKVISION_EVENT = f"{DOMAIN}_event"
+# Dispatcher signal for binary sensor state received in event notification, formatted with entity unique id
+SIGNAL_EVENT_STATE = f"{DOMAIN}_event_state_{{}}"
 
 # Auto-reset timeout in seconds for event-based binary sensors
 # When an event is received, the sensor will automatically reset to OFF
 # after this timeout if no new events are received
 EVENT_AUTO_RESET_TIMEOUT: Final = 5
 
-EVENTS = {
+EVENTS = MappingProxyType({
     "motiondetection": {
         **ISAPI_EVENTS["motiondetection"],
         "device_class": BinarySensorDeviceClass.MOTION,
@@ -98,4 +101,4 @@ EVENTS = {
         **ISAPI_EVENTS["unattendedbaggage"],
         "device_class": BinarySensorDeviceClass.PROBLEM,
     },
-}
+})
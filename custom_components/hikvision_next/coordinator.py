@@ -2,21 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.components.switch import ENTITY_ID_FORMAT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import slugify
 
 from .const import CONF_ALARM_SERVER_HOST, DOMAIN, HOLIDAY_MODE
+from .isapi import ISAPIUnauthorizedError
 
 SCAN_INTERVAL_EVENTS = timedelta(seconds=120)
 SCAN_INTERVAL_HOLIDAYS = timedelta(minutes=60)
 
 _LOGGER = logging.getLogger(__name__)
 
+STORAGE = "storage"
+
+# embedded devices answer request bursts with 503/401 errors, limit requests sent at once to a single device
+MAX_CONCURRENT_REQUESTS = 8
+
+
+async def _limited(semaphore: asyncio.Semaphore, request: Awaitable) -> Any:
+    """Await request once a slot of the semaphore is free."""
+    async with semaphore:
+        return await request
+
+
+async def gather_requests(device, requests: dict[str, tuple[Awaitable, str]]) -> dict[str, Any]:
+    """Run independent ISAPI requests concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
+
+    :param requests: result key -> (request coroutine, error details)
+    Return results of succeeded requests, failed ones are handled by the device and skipped.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(
+        *(_limited(semaphore, request) for request, _ in requests.values()), return_exceptions=True
+    )
+    data = {}
+    unauthorized = False
+    for (key, (_, details)), result in zip(requests.items(), results):
+        if not isinstance(result, BaseException):
+            data[key] = result
+            continue
+        if not isinstance(result, Exception):
+            raise result
+        if isinstance(result, ISAPIUnauthorizedError):
+            # requests were sent concurrently with the same token, report expired token only once
+            if unauthorized:
+                continue
+            unauthorized = True
+        device.handle_exception(result, details)
+    return data
+
 
 class EventsCoordinator(DataUpdateCoordinator):
     """Manage fetching events state from NVR or camera."""
@@ -34,43 +75,29 @@ class EventsCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Update data via ISAPI."""
-        data = {}
-
-        # Get camera event status
-        for camera in self.device.cameras:
-            for event in camera.events_info:
-                if event.disabled:
-                    continue
-                try:
-                    _id = ENTITY_ID_FORMAT.format(event.unique_id)
-                    data[_id] = await self.device.get_event_enabled_state(event)
-                except Exception as ex:  # pylint: disable=broad-except
-                    self.device.handle_exception(ex, f"Cannot fetch state for {event.id}")
-
-        # Get NVR event status
-        for event in self.device.events_info:
+        requests = {}
+
+        # Get camera and NVR event status
+        events = [event for camera in self.device.cameras for event in camera.events_info]
+        events.extend(self.device.events_info)
+        for event in events:
             if event.disabled:
                 continue
-            try:
-                _id = ENTITY_ID_FORMAT.format(event.unique_id)
-                data[_id] = await self.device.get_event_enabled_state(event)
-            except Exception as ex:  # pylint: disable=broad-except
-                self.device.handle_exception(ex, f"Cannot fetch state for {event.id}")
+            _id = ENTITY_ID_FORMAT.format(event.unique_id)
+            requests[_id] = (self.device.get_event_enabled_state(event), f"Cannot fetch state for {event.id}")
 
         # Get output port(s) status
+        serial_no = self.device.serial_no_slug
         for i in range(1, self.device.capabilities.output_ports + 1):
-            try:
-                _id = ENTITY_ID_FORMAT.format(f"{slugify(self.device.device_info.serial_no.lower())}_{i}_alarm_output")
-                data[_id] = await self.device.get_io_port_status("output", i)
-            except Exception as ex:  # pylint: disable=broad-except
-                self.device.handle_exception(ex, f"Cannot fetch state for alarm output {i}")
+            _id = ENTITY_ID_FORMAT.format(f"{serial_no}_{i}_alarm_output")
+            requests[_id] = (self.device.get_io_port_status("output", i), f"Cannot fetch state for alarm output {i}")
 
         # Refresh HDD data
-        try:
-            self.device.storage = await self.device.get_storage_devices()
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, "Cannot fetch storage state")
+        requests[STORAGE] = (self.device.get_storage_devices(), "Cannot fetch storage state")
 
+        data = await gather_requests(self.device, requests)
+        if STORAGE in data:
+            self.device.storage = data.pop(STORAGE)
 
         if self.device.auth_token_expired:
             self.device.auth_token_expired = False
@@ -90,26 +117,31 @@ class SecondaryCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL_HOLIDAYS,
+            always_update=False,
         )
 
     async def _async_update_data(self):
         """Update data via ISAPI."""
-        data = {}
-        try:
-            if self.device.capabilities.support_holiday_mode:
-                data[HOLIDAY_MODE] = await self.device.get_holiday_enabled_state()
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, f"Cannot fetch state for {HOLIDAY_MODE}")
-        try:
-            if self.device.capabilities.support_alarm_server:
-                alarm_server = await self.device.get_alarm_server()
-                data[CONF_ALARM_SERVER_HOST] = {
-                    "protocol_type": alarm_server.protocol_type,
-                    "address": alarm_server.ip_address or alarm_server.host_name,
-                    "port_no": alarm_server.port_no,
-                    "path": alarm_server.url,
-
-                }
-        except Exception as ex:  # pylint: disable=broad-except
-            self.device.handle_exception(ex, f"Cannot fetch state for {CONF_ALARM_SERVER_HOST}")
+        requests = {}
+        if self.device.capabilities.support_holiday_mode:
+            requests[HOLIDAY_MODE] = (
+                self.device.get_holiday_enabled_state(),
+                f"Cannot fetch state for {HOLIDAY_MODE}",
+            )
+        if self.device.capabilities.support_alarm_server:
+            requests[CONF_ALARM_SERVER_HOST] = (
+                self.device.get_alarm_server(),
+                f"Cannot fetch state for {CONF_ALARM_SERVER_HOST}",
+            )
+
+        data = await gather_requests(self.device, requests)
+        if alarm_server := data.get(CONF_ALARM_SERVER_HOST):
+            data[CONF_ALARM_SERVER_HOST] = {
+                "protocol_type": alarm_server.protocol_type,
+                "address": alarm_server.ip_address or alarm_server.host_name,
+                "port_no": alarm_server.port_no,
+                "path": alarm_server.url,
+            }
+        # storage is refreshed by events coordinator, include it so storage sensors update on change
+        data[STORAGE] = self.device.storage
         return data
@@ -7,13 +7,11 @@ import json
 import random
 from typing import Any
 
-from httpx import HTTPStatusError
-
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import HikvisionConfigEntry
-from .isapi import ISAPIForbiddenError, ISAPIUnauthorizedError
+from .isapi import ISAPIRequestError
 from .isapi.const import GET, STREAM_TYPE
 
 
@@ -117,7 +115,7 @@ async def get_isapi_data(isapi, endpoint: str) -> dict:
     try:
         response = await isapi.request(GET, endpoint)
         entry["response"] = anonymise_data(response)
-    except (HTTPStatusError, ISAPIUnauthorizedError, ISAPIForbiddenError) as ex:
+    except ISAPIRequestError as ex:
         entry["status_code"] = ex.response.status_code
     except Exception as ex:  # noqa: BLE001
         entry["error"] = ex
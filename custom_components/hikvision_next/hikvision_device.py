@@ -1,5 +1,8 @@
 "ISAPI client for Home Assistant integration."
 
+import asyncio
+from collections import defaultdict
+from functools import cached_property
 import logging
 from typing import Any
 
@@ -31,7 +34,7 @@ from .isapi import (
     ISAPIForbiddenError,
     ISAPIUnauthorizedError,
 )
-from .isapi.const import EVENT_IO, EVENT_VIDEOINTERCOM
+from .isapi.const import DEVICE_LEVEL_EVENT_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,14 +67,20 @@ class HikvisionDevice(ISAPIClient):
         super().__init__(host, username, password, verify_ssl, rtsp_port_forced, session)
 
         self.events_info: list[EventInfo] = []
+        self._hass_device_info: dict[int, DeviceInfo] = {}
 
     async def init_coordinators(self):
         """Initialize coordinators."""
 
         # init events supported by integration
         self.events_info = self.get_device_event_capabilities()
+        # group supported events by channel once instead of scanning all of them for every camera
+        channel_events: dict[int, list[EventInfo]] = defaultdict(list)
+        for event in self.supported_events:
+            if event.id in EVENTS:
+                channel_events[event.channel_id].append(event)
         for camera in self.cameras:
-            camera.events_info = self.get_device_event_capabilities(camera.id)
+            camera.events_info = self.get_device_event_capabilities(camera.id, channel_events[int(camera.id)])
 
         # create coordinators
         self.coordinators = {}
@@ -87,11 +96,23 @@ class HikvisionDevice(ISAPIClient):
             await self.set_alarm_server(self.alarm_server_host, ALARM_SERVER_PATH)
 
         # first data fetch
-        for coordinator in self.coordinators.values():
-            await coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            *(coordinator.async_config_entry_first_refresh() for coordinator in self.coordinators.values())
+        )
+
+    @cached_property
+    def serial_no_slug(self) -> str:
+        """Return slugified serial number used in entity ids, available after device info is fetched."""
+        return slugify(self.device_info.serial_no.lower())
 
     def hass_device_info(self, camera_id: int = 0) -> DeviceInfo:
         """Return Home Assistant entity device information."""
+        if (device_info := self._hass_device_info.get(camera_id)) is None:
+            device_info = self._hass_device_info[camera_id] = self._build_hass_device_info(camera_id)
+        return device_info
+
+    def _build_hass_device_info(self, camera_id: int) -> DeviceInfo:
+        """Build Home Assistant device information, shared by all entities of device or camera."""
         if camera_id == 0:
             return DeviceInfo(
                 manufacturer=self.device_info.manufacturer,
@@ -117,27 +138,35 @@ class HikvisionDevice(ISAPIClient):
     def get_device_event_capabilities(
         self,
         camera_id: int | None = None,
+        channel_events: list[EventInfo] | None = None,
     ) -> list[EventInfo]:
-        """Get events info handled by integration (camera id:  NVR = None, camera > 0)."""
+        """Get events info handled by integration (camera id:  NVR = None, camera > 0).
+
+        :param channel_events: supported events of camera channel handled by integration, if already grouped
+        """
         events = []
 
         if camera_id is None:  # NVR/Device-level events
             integration_supported_events = [
                 s for s in self.supported_events if (
                     s.id in EVENTS and
-                    EVENTS[s.id].get("type") in (EVENT_IO, EVENT_VIDEOINTERCOM)
+                    EVENTS[s.id].get("type") in DEVICE_LEVEL_EVENT_TYPES
                 )
             ]
+        elif channel_events is not None:
+            integration_supported_events = channel_events
         else:  # Camera
             integration_supported_events = [
                 s for s in self.supported_events if (s.channel_id == int(camera_id) and s.id in EVENTS)
             ]
 
+        # unique_id prefix is the same for all events of a device or camera
+        device_id_param = f"_{camera_id}" if camera_id else ""
+        unique_id_prefix = f"{self.serial_no_slug}{device_id_param}"
         for event in integration_supported_events:
             # Build unique_id
-            device_id_param = f"_{camera_id}" if camera_id else ""
             io_port_id_param = f"_{event.io_port_id}" if event.io_port_id != 0 else ""
-            unique_id = f"{slugify(self.device_info.serial_no.lower())}{device_id_param}{io_port_id_param}_{event.id}"
+            unique_id = f"{unique_id_prefix}{io_port_id_param}_{event.id}"
 
             if EVENTS.get(event.id):
                 event.unique_id = unique_id
@@ -2,6 +2,7 @@ from .isapi import (  # noqa: F401
     ISAPIActiveDeterrenceNotSupportedError,
     ISAPIClient,
     ISAPIForbiddenError,
+    ISAPIRequestError,
     ISAPISetEventStateMutexError,
     ISAPIUnauthorizedError,
 )
@@ -12,6 +13,5 @@ from .models import (  # noqa: F401
     EventInfo,
     IPCamera,
     StorageInfo,
-    TwoWayAudioInfo,
     TwoWayAudioChannelInfo,
 )
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Final
 
 GET = "GET"
@@ -12,7 +13,11 @@ EVENT_IO: Final = "io"
 EVENT_SMART: Final = "smart"
 EVENT_PIR: Final = "pir"
 EVENT_VIDEOINTERCOM: Final = "videointercom"
-EVENTS = {
+
+# Event types reported for the whole device, not for a camera channel
+DEVICE_LEVEL_EVENT_TYPES: Final = frozenset((EVENT_IO, EVENT_VIDEOINTERCOM))
+
+EVENTS = MappingProxyType({
     "motiondetection": {
         "type": EVENT_BASIC,
         "label": "Motion",
@@ -95,7 +100,7 @@ EVENTS = {
         "label": "Unattended Baggage",
         "slug": "UnattendedBaggage",
     },
-}
+})
 
 STREAM_TYPE = {
     1: "Main Stream",
@@ -115,3 +120,5 @@ EVENTS_ALTERNATE_ID = {
 }
 
 MUTEX_ALTERNATE_ID = {"motiondetection": "VMDHumanVehicle"}
+
+STROBE_FREQUENCIES: Final = frozenset(("low", "medium", "high", "constant"))
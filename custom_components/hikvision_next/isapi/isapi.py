@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
 import datetime
+from functools import lru_cache
 from http import HTTPStatus
 import ipaddress
 import json
 import logging
+import re
+import sys
 from typing import Any, AsyncIterator
 from urllib.parse import quote, urljoin, urlparse
+from xml.etree import ElementTree
 
 import httpx
 from httpx import HTTPStatusError
@@ -29,6 +34,7 @@ from .const import (
     POST,
     PUT,
     STREAM_TYPE,
+    STROBE_FREQUENCIES,
 )
 from .models import (
     AlarmServer,
@@ -42,7 +48,6 @@ from .models import (
     MutexIssue,
     ProtocolsInfo,
     StorageInfo,
-    TwoWayAudioInfo,
     TwoWayAudioChannelInfo,
 )
 from .utils import bool_to_str, deep_get, parse_isapi_response, str_to_bool
@@ -52,6 +57,80 @@ Node = dict[str, Any]
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _event_id(event_type: str) -> str:
+    """Get canonical event id for event type reported by device.
+
+    Interned, so ids of incoming alerts are the same objects as the EVENTS keys.
+    """
+    event_id = sys.intern(event_type.lower())
+    # Translate to alternate IDs
+    return EVENTS_ALTERNATE_ID.get(event_id, event_id)
+
+
+# EventNotificationAlert fields read by the integration, nested ones are unique within the message
+_ALERT_FIELDS = (
+    "eventType",
+    "relationEvent",
+    "channelID",
+    "dynChannelID",
+    "inputIOPortID",
+    "serialNumber",
+    "macAddress",
+    "detectionTarget",
+    "regionID",
+)
+_ALERT_FIELD_NAMES = frozenset(_ALERT_FIELDS)
+# Matches only non blank field text, with surrounding whitespace stripped by the pattern itself
+_ALERT_FIELD_RE = re.compile(r"<(" + "|".join(_ALERT_FIELDS) + r")(?:\s[^>]*)?>\s*([^<\s][^<]*?)\s*</\1>")
+
+# Request bodies depending only on a boolean are serialized once
+_OUTPUT_PORT_TRIGGER_XML = {
+    turn_on: xmltodict.unparse({"IOPortData": {"outputState": "high" if turn_on else "low"}})
+    for turn_on in (True, False)
+}
+_PTZ_PATROL_STATUS_XML = {
+    enabled: xmltodict.unparse(
+        {"PTZPatrolStatus": {"enabled": bool_to_str(enabled), "status": "start" if enabled else "stop"}}
+    )
+    for enabled in (True, False)
+}
+
+
+def _read_alert_fields(xml: str) -> dict[str, str]:
+    """Read non empty alert fields from EventNotificationAlert XML message.
+
+    Known notification shapes are read with a single regex scan without building the element tree,
+    unexpected ones, e.g. with prefixed namespaces, are walked once by the pull parser with
+    namespaces stripped from tags.
+    """
+    if "<EventNotificationAlert" in xml:
+        # reversed so the first occurrence of a field wins
+        fields = dict(reversed(_ALERT_FIELD_RE.findall(xml)))
+        if "eventType" in fields or "relationEvent" in fields:
+            return fields
+
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    # Fix for some cameras sending non html encoded data
+    parser.feed(xml.replace("&", "&amp;"))
+    parser.close()
+    events = parser.read_events()
+    _, root = next(events)
+    if root.tag.rpartition("}")[2] != "EventNotificationAlert":
+        raise ValueError(f"Unexpected notification {root.tag}")
+    fields = {}
+    for event, element in events:
+        if event != "end":
+            continue
+        if element.text:
+            tag = element.tag.rpartition("}")[2]
+            if tag in _ALERT_FIELD_NAMES and tag not in fields and (text := element.text.strip()):
+                fields[tag] = text
+        # drop the already read subtree so nested payloads are not kept until the root is released
+        element.clear()
+    return fields
+
+
 class ISAPIClient:
     """Hikvision ISAPI client."""
 
@@ -73,19 +152,23 @@ class ISAPIClient:
         self.timeout = 20
         self.isapi_prefix = "ISAPI"
         self._session = session
+        self._owns_session = False
         self._auth_method: httpx._auth.Auth = None
+        # concurrent requests wait for a single authentication method detection
+        self._auth_lock = asyncio.Lock()
 
         self.rtsp_port_forced = rtsp_port_forced
 
         self.device_info = ISAPIDeviceInfo()
         self.capabilities = CapabilitiesInfo()
         self.cameras: list[IPCamera | AnalogCamera] = []
+        self.cameras_by_serial: dict[str, IPCamera | AnalogCamera] = {}
+        self.ip_cameras_by_port: dict[int, IPCamera] = {}
         self.supported_events: list[EventInfo] = []
-        self.storage: list[StorageInfo] = []
+        self.storage: tuple[StorageInfo, ...] = ()
         self.protocols = ProtocolsInfo()
-        self.two_way_audio: list[TwoWayAudioInfo] = []
+        self.two_way_audio: list[TwoWayAudioChannelInfo] = []
         self.pending_initialization = False
-        self.two_way_audio_channels: list[TwoWayAudioChannelInfo] = []
 
     async def get_device_info(self):
         """Get device info."""
@@ -132,10 +215,6 @@ class ISAPIClient:
         )
         self.capabilities.support_voice = self.capabilities.audio_outputs > 0
 
-        # Check for two-way audio support based on voicetalkNums capability
-        voicetalk_nums = int(capabilities.get("voicetalkNums", 0))
-        self.capabilities.support_two_way_audio = voicetalk_nums > 0
-
         # Set if NVR based on whether more than 1 supported IP or analog cameras
         # Single IP camera will show 0 supported devices in total
         if self.capabilities.analog_cameras_inputs + self.capabilities.digital_cameras_inputs > 1:
@@ -154,6 +233,7 @@ class ISAPIClient:
         if self.capabilities.support_two_way_audio:
             with suppress(Exception):
                 self.two_way_audio = await self.get_two_way_audio_channels()
+
     async def _check_video_intercom_support(self) -> bool:
         """Check if the device supports VideoIntercom (doorbell) functionality."""
         try:
@@ -162,10 +242,6 @@ class ISAPIClient:
             return bool(call_status and call_status.get("CallStatus"))
         except Exception:
             return False
-        # Fetch two-way audio channels if supported
-        if self.capabilities.support_two_way_audio:
-            with suppress(Exception):
-                self.two_way_audio_channels = await self.get_two_way_audio_channels()
 
     async def get_cameras(self):
         """Get camera objects for all connected cameras."""
@@ -199,7 +275,7 @@ class ISAPIClient:
                     ip_addr=self.device_info.ip_address,
                     streams=await self.get_camera_streams(channel_id),
                 )
-                self.cameras.append(camera)
+                self._add_camera(camera)
         else:
             # Get analog and digital cameras attached to NVR
             if self.capabilities.digital_cameras_inputs > 0:
@@ -220,7 +296,7 @@ class ISAPIClient:
                         # serial no is not always recognized correcly by NVR
                         serial_no = f"{self.device_info.serial_no}_{source.get("proxyProtocol")}_{camera_id}"
 
-                    self.cameras.append(
+                    self._add_camera(
                         IPCamera(
                             id=int(camera_id),
                             name=digital_camera.get("name"),
@@ -247,7 +323,7 @@ class ISAPIClient:
                     camera_id = analog_camera.get("id")
                     device_serial_no = f"{self.device_info.serial_no}-VI{camera_id}"
 
-                    self.cameras.append(
+                    self._add_camera(
                         AnalogCamera(
                             id=int(camera_id),
                             name=analog_camera.get("name"),
@@ -284,10 +360,7 @@ class ISAPIClient:
             event_type = event_trigger.get("eventType")
             if not event_type:
                 return None
-            event_id = event_type.lower()
-            # Translate to alternate IDs
-            if event_id in EVENTS_ALTERNATE_ID:
-                event_id = EVENTS_ALTERNATE_ID[event_id]
+            event_id = _event_id(event_type)
 
             if event_id == EVENT_PIR:
                 is_supported = str_to_bool(deep_get(system_capabilities, "WLAlarmCap.isSupportPIR", False))
@@ -353,9 +426,7 @@ class ISAPIClient:
                 event_types = deep_get(event_cap, "eventType").get("@opt", "").split(",")
                 channel_id = int(event_cap.get("channelID"))
                 for event_type in event_types:
-                    event_id = event_type.lower()
-                    if event_id in EVENTS_ALTERNATE_ID:
-                        event_id = EVENTS_ALTERNATE_ID[event_id]
+                    event_id = _event_id(event_type)
                     if event_id not in EVENTS:
                         continue
                     if not [e for e in events if (e.id == event_id and e.channel_id == channel_id)]:
@@ -411,9 +482,12 @@ class ISAPIClient:
     async def get_camera_streams(self, channel_id: int) -> list[CameraStreamInfo]:
         """Get stream info for all cameras."""
         streams = []
-        for stream_type_id, stream_type in STREAM_TYPE.items():
-            stream_id = f"{channel_id}0{stream_type_id}"
-            stream_info = (await self.request(GET, f"Streaming/channels/{stream_id}")).get("StreamingChannel")
+        # stream requests are independent, fetch them concurrently
+        responses = await asyncio.gather(
+            *(self.request(GET, f"Streaming/channels/{channel_id}0{stream_type_id}") for stream_type_id in STREAM_TYPE)
+        )
+        for (stream_type_id, stream_type), response in zip(STREAM_TYPE.items(), responses):
+            stream_info = response.get("StreamingChannel")
             if not stream_info:
                 continue
             streams.append(
@@ -433,22 +507,22 @@ class ISAPIClient:
 
     def get_camera_by_id(self, camera_id: int) -> IPCamera | AnalogCamera | None:
         """Get camera object by id."""
-        try:
-            if camera_id == 0:
-                return None
-            return [camera for camera in self.cameras if camera.id == camera_id][0]
-        except IndexError:
-            # Camera id does not exist
+        if camera_id == 0:
             return None
+        return next((camera for camera in self.cameras if camera.id == camera_id), None)
 
     def get_camera_by_serial_no(self, serial_no: str) -> IPCamera | AnalogCamera | None:
         """Get camera object by serial number."""
-        for c in self.cameras:
-            if c.serial_no == serial_no:
-                return c
-        return None
+        return self.cameras_by_serial.get(serial_no)
 
-    async def get_storage_devices(self):
+    def _add_camera(self, camera: IPCamera | AnalogCamera) -> None:
+        """Add camera and index it by serial number and, for IP cameras, by input port."""
+        self.cameras.append(camera)
+        self.cameras_by_serial.setdefault(camera.serial_no, camera)
+        if isinstance(camera, IPCamera):
+            self.ip_cameras_by_port.setdefault(camera.input_port, camera)
+
+    async def get_storage_devices(self) -> tuple[StorageInfo, ...]:
         """Get HDD and NAS storage devices."""
         storage_list = []
         storage_info = (await self.request(GET, "ContentMgmt/Storage")).get("storage", {})
@@ -458,80 +532,45 @@ class ISAPIClient:
             if not isinstance(hdd_list, list):
                 hdd_list = [hdd_list]
             for storage in hdd_list:
-                storage = storage.get("hdd")
-                if not isinstance(storage, list):
-                    storage = [storage]
-                if storage:
-                    for item in storage:
-                        storage_list.append(  # noqa: PERF401
-                            StorageInfo(
-                                id=int(item.get("id")),
-                                name=item.get("hddName"),
-                                type=item.get("hddType"),
-                                status=item.get("status"),
-                                capacity=int(item.get("capacity")),
-                                freespace=int(item.get("freeSpace")),
-                                property=item.get("property"),
-                            )
+                for item in deep_get(storage, "hdd", []):
+                    storage_list.append(  # noqa: PERF401
+                        StorageInfo(
+                            id=int(item.get("id")),
+                            name=item.get("hddName"),
+                            type=item.get("hddType"),
+                            status=item.get("status"),
+                            capacity=int(item.get("capacity")),
+                            freespace=int(item.get("freeSpace")),
+                            property=item.get("property"),
                         )
+                    )
 
         nas_list = storage_info.get("nasList") or {}
         if "nas" in nas_list:
             if not isinstance(nas_list, list):
                 nas_list = [nas_list]
             for storage in nas_list:
-                storage = storage.get("nas")
-                if not isinstance(storage, list):
-                    storage = [storage]
-                if storage:
-                    for item in storage:
-                        storage_list.append(  # noqa: PERF401
-                            StorageInfo(
-                                id=int(item.get("id")),
-                                name=item.get("path"),
-                                type=item.get("nasType"),
-                                status=item.get("status"),
-                                capacity=int(item.get("capacity")),
-                                freespace=int(item.get("freeSpace")),
-                                property=item.get("property"),
-                                ip=item.get("ipAddress"),
-                            )
+                for item in deep_get(storage, "nas", []):
+                    storage_list.append(  # noqa: PERF401
+                        StorageInfo(
+                            id=int(item.get("id")),
+                            name=item.get("path"),
+                            type=item.get("nasType"),
+                            status=item.get("status"),
+                            capacity=int(item.get("capacity")),
+                            freespace=int(item.get("freeSpace")),
+                            property=item.get("property"),
+                            ip=item.get("ipAddress"),
                         )
+                    )
 
-        return storage_list
+        return tuple(storage_list)
 
     def get_storage_device_by_id(self, device_id: int) -> StorageInfo | None:
         """Get storage object by id."""
-        try:
-            return [storage_device for storage_device in self.storage if storage_device.id == device_id][0]
-        except IndexError:
-            # Storage id does not exist
-            return None
+        return next((storage_device for storage_device in self.storage if storage_device.id == device_id), None)
 
-    async def get_two_way_audio_channels(self) -> list[TwoWayAudioInfo]:
-        """Get two-way audio channels from device."""
-        channels = []
-        try:
-            response = await self.request(GET, "System/TwoWayAudio/channels")
-            channel_list = deep_get(response, "TwoWayAudioChannelList.TwoWayAudioChannel", [])
-            if not isinstance(channel_list, list):
-                channel_list = [channel_list]
-            for channel in channel_list:
-                channels.append(
-                    TwoWayAudioInfo(
-                        id=int(channel.get("id", 1)),
-                        enabled=str_to_bool(channel.get("enabled", "false")),
-                        audio_compression=channel.get("audioCompressionType", "G.711ulaw"),
-                        audio_input_type=channel.get("audioInputType", "MicIn"),
-                        speaker_volume=int(channel.get("speakerVolume", 50)),
-                        mic_volume=int(channel.get("noisereduce", 50)),
-                    )
-                )
-        except Exception as ex:
-            _LOGGER.debug("Two-way audio not supported or error fetching channels: %s", ex)
-        return channels
-
-    def get_two_way_audio_channel_by_id(self, channel_id: int) -> TwoWayAudioInfo | None:
+    def get_two_way_audio_channel_by_id(self, channel_id: int) -> TwoWayAudioChannelInfo | None:
         """Get two-way audio channel by id."""
         for channel in self.two_way_audio:
             if channel.id == channel_id:
@@ -564,7 +603,7 @@ class ISAPIClient:
         try:
             full_url = self.get_isapi_url(f"System/TwoWayAudio/channels/{channel_id}/audioData")
             if not self._auth_method:
-                await self._detect_auth_method()
+                await self._ensure_auth_method()
 
             response = await self._session.request(
                 PUT,
@@ -666,13 +705,7 @@ class ISAPIClient:
 
     async def set_output_port_state(self, port_no: int, turn_on: bool):
         """Set status of output port."""
-        data = {}
-        if turn_on:
-            data["IOPortData"] = {"outputState": "high"}
-        else:
-            data["IOPortData"] = {"outputState": "low"}
-
-        xml = xmltodict.unparse(data)
+        xml = _OUTPUT_PORT_TRIGGER_XML[bool(turn_on)]
         await self.request(PUT, f"System/IO/outputs/{port_no}/trigger", present="xml", data=xml)
 
     async def get_holiday_enabled_state(self, holiday_index=0) -> bool:
@@ -823,8 +856,7 @@ class ISAPIClient:
         if not self.capabilities.support_strobe:
             raise ISAPIActiveDeterrenceNotSupportedError("strobe")
 
-        valid_frequencies = ["low", "medium", "high", "constant"]
-        if frequency not in valid_frequencies:
+        if frequency not in STROBE_FREQUENCIES:
             frequency = "medium"
 
         data = {
@@ -865,20 +897,21 @@ class ISAPIClient:
         }
 
         await self.request(PUT, "Event/triggers/notifications/AudioAlarm?format=json", present="json", data=json.dumps(data))
+
     async def get_two_way_audio_channels(self) -> list[TwoWayAudioChannelInfo]:
         """Get two-way audio channels."""
         channels = []
         response = await self.request(GET, "System/TwoWayAudio/channels")
-        channel_list = deep_get(response, "TwoWayAudioChannelList.TwoWayAudioChannel", [])
-        if not isinstance(channel_list, list):
-            channel_list = [channel_list]
-        for channel in channel_list:
+        for channel in deep_get(response, "TwoWayAudioChannelList.TwoWayAudioChannel", []):
             if channel is not None and isinstance(channel, dict):
                 channels.append(
                     TwoWayAudioChannelInfo(
                         id=int(channel.get("id", 1)),
                         enabled=str_to_bool(channel.get("enabled", "false")),
                         audio_compression_type=channel.get("audioCompressionType", "G.711ulaw"),
+                        audio_input_type=channel.get("audioInputType", "MicIn"),
+                        speaker_volume=int(channel.get("speakerVolume", 50)),
+                        mic_volume=int(channel.get("noisereduce", 50)),
                     )
                 )
         return channels
@@ -918,45 +951,29 @@ class ISAPIClient:
             enabled: True to start patrol, False to stop.
         """
         url = f"PTZCtrl/channels/{channel_id}/patrols/{patrol_id}/status"
-        status = "start" if enabled else "stop"
-        data = {
-            "PTZPatrolStatus": {
-                "enabled": "true" if enabled else "false",
-                "status": status,
-            }
-        }
-        xml = xmltodict.unparse(data)
-        await self.request(PUT, url, present="xml", data=xml)
+        await self.request(PUT, url, present="xml", data=_PTZ_PATROL_STATUS_XML[bool(enabled)])
 
     @staticmethod
     def parse_event_notification(xml: str) -> AlertInfo:
         """Parse incoming EventNotificationAlert XML message."""
 
-        # Fix for some cameras sending non html encoded data
-        xml = xml.replace("&", "&amp;")
-
-        data = xmltodict.parse(xml)
-        alert = data["EventNotificationAlert"]
+        fields = _read_alert_fields(xml)
 
-        event_id = alert.get("eventType")
+        event_id = fields.get("eventType")
         if not event_id or event_id == "duration":
             # <EventNotificationAlert version="2.0"
-            event_id = alert["DurationList"]["Duration"]["relationEvent"]
-        event_id = event_id.lower()
+            event_id = fields.get("relationEvent")
+        event_id = _event_id(event_id)
 
-        # handle alternate event type
-        if EVENTS_ALTERNATE_ID.get(event_id):
-            event_id = EVENTS_ALTERNATE_ID[event_id]
-
-        channel_id = int(alert.get("channelID", alert.get("dynChannelID", 0)))
-        io_port_id = int(alert.get("inputIOPortID", 0))
+        channel_id = int(fields.get("channelID") or fields.get("dynChannelID") or 0)
+        io_port_id = int(fields.get("inputIOPortID", 0))
         # <EventNotificationAlert version="1.0"
-        device_serial = deep_get(alert, "Extensions.serialNumber.#text")
+        device_serial = fields.get("serialNumber")
         # <EventNotificationAlert version="2.0"
-        mac = alert.get("macAddress")
+        mac = fields.get("macAddress")
 
-        detection_target = deep_get(alert, "DetectionRegionList.DetectionRegionEntry.detectionTarget")
-        region_id = int(deep_get(alert, "DetectionRegionList.DetectionRegionEntry.regionID", 0))
+        detection_target = fields.get("detectionTarget")
+        region_id = int(fields.get("regionID", 0))
 
         if not EVENTS[event_id]:
             raise ValueError(f"Unsupported event {event_id}")
@@ -986,14 +1003,12 @@ class ISAPIClient:
                 "videoResolutionHeight": stream.height,
             }
 
+        # alternate url is remembered on the stream, so later snapshots go straight to the working url
         if stream.use_alternate_picture_url:
             url = f"ContentMgmt/StreamingProxy/channels/{stream.id}/picture"
-            full_url = self.get_isapi_url(url)
-            chunks = self.request_bytes(GET, full_url, params=params)
         else:
             url = f"Streaming/channels/{stream.id}/picture"
-            full_url = self.get_isapi_url(url)
-            chunks = self.request_bytes(GET, full_url, params=params)
+        chunks = self.request_bytes(GET, self.get_isapi_url(url), params=params)
         data = b"".join([chunk async for chunk in chunks])
 
         if data.startswith(b"<?xml "):
@@ -1016,10 +1031,21 @@ class ISAPIClient:
         url = f"{self.device_info.ip_address}:{self.protocols.rtsp_port}/Streaming/channels/{stream.id}"
         return f"rtsp://{u}:{p}@{url}"
 
+    async def _ensure_auth_method(self) -> None:
+        """Detect authentication method once, requests sent concurrently wait for the first detection."""
+        async with self._auth_lock:
+            if not self._auth_method:
+                await self._detect_auth_method()
+
     async def _detect_auth_method(self):
         """Establish the connection with device."""
         if not self._session:
-            self._session = httpx.AsyncClient(timeout=self.timeout, verify=self.verify_ssl)
+            self._session = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            )
+            self._owns_session = True
 
         url = urljoin(self.host, self.isapi_prefix + "/System/deviceInfo")
         _LOGGER.debug("--- [WWW-Authenticate detection] %s", self.host)
@@ -1037,6 +1063,13 @@ class ISAPIClient:
             if response.headers:
                 _LOGGER.error("response.headers %s", response.headers)
 
+    async def aclose(self) -> None:
+        """Close HTTP session if it was created by the client."""
+        if self._session and self._owns_session:
+            await self._session.aclose()
+            self._session = None
+            self._owns_session = False
+
     def get_isapi_url(self, relative_url: str) -> str:
         """Build full ISAPI URL."""
         return f"{self.host}/{self.isapi_prefix}/{relative_url}"
@@ -1052,7 +1085,7 @@ class ISAPIClient:
         full_url = self.get_isapi_url(url)
         try:
             if not self._auth_method:
-                await self._detect_auth_method()
+                await self._ensure_auth_method()
 
             response = await self._session.request(
                 method,
@@ -1076,7 +1109,7 @@ class ISAPIClient:
             if self.pending_initialization:
                 # supress http errors during initialization
                 return {}
-            raise
+            raise ISAPIRequestError(ex) from ex
         else:
             return result
 
@@ -1090,7 +1123,7 @@ class ISAPIClient:
 
         try:
             if not self._auth_method:
-                await self._detect_auth_method()
+                await self._ensure_auth_method()
 
             async with self._session.stream(method, full_url, auth=self._auth_method, **data) as response:
                 async for chunk in response.aiter_bytes():
@@ -1111,22 +1144,31 @@ class ISAPISetEventStateMutexError(Exception):
             on channels {mutex_issues[0].channels} first"""
 
 
-class ISAPIUnauthorizedError(Exception):
+class ISAPIRequestError(HTTPStatusError):
+    """Base for ISAPI request errors, response holds the device error response."""
+
+    def __init__(self, ex: HTTPStatusError, *args) -> None:
+        """Initialize exception."""
+        super().__init__(str(ex), request=ex.request, response=ex.response)
+        self.message = str(ex)
+
+
+class ISAPIUnauthorizedError(ISAPIRequestError):
     """HTTP Error 401."""
 
     def __init__(self, ex: HTTPStatusError, *args) -> None:
         """Initialize exception."""
+        super().__init__(ex)
         self.message = f"Unauthorized request {ex.request.url}, check username and password."
-        self.response = ex.response
 
 
-class ISAPIForbiddenError(Exception):
+class ISAPIForbiddenError(ISAPIRequestError):
     """HTTP Error 403."""
 
     def __init__(self, ex: HTTPStatusError, *args) -> None:
         """Initialize exception."""
+        super().__init__(ex)
         self.message = f"Forbidden request {ex.request.url}, check user permissions."
-        self.response = ex.response
         _LOGGER.warning(self.message)
 
 
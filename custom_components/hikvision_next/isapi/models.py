@@ -12,7 +12,7 @@ class AlarmServer:
     protocol_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertInfo:
     """Holds NVR/Camera event notification info."""
 
@@ -47,7 +47,7 @@ class EventInfo:
     notifications: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraStreamInfo:
     """Holds info of a camera stream."""
 
@@ -63,7 +63,7 @@ class CameraStreamInfo:
     use_alternate_picture_url: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StorageInfo:
     """Holds info for internal and NAS storage devices."""
 
@@ -147,18 +147,12 @@ class ProtocolsInfo:
 
 
 @dataclass
-class TwoWayAudioInfo:
-    """Holds info for two-way audio channel."""
-
-    id: int
-    enabled: bool
-    audio_compression: str  # e.g., "G.711ulaw", "G.711alaw", "G.722.1", "G.726", "MP2L2", "PCM"
-    audio_input_type: str  # e.g., "MicIn", "LineIn"
-    speaker_volume: int = 50
-    mic_volume: int = 50
 class TwoWayAudioChannelInfo:
     """Holds info of a two-way audio channel."""
 
     id: int
     enabled: bool
-    audio_compression_type: str
+    audio_compression_type: str  # e.g., "G.711ulaw", "G.711alaw", "G.722.1", "G.726", "MP2L2", "PCM"
+    audio_input_type: str = "MicIn"  # e.g., "MicIn", "LineIn"
+    speaker_volume: int = 50
+    mic_volume: int = 50
@@ -1,4 +1,4 @@
-from functools import reduce
+from functools import lru_cache, reduce
 import json
 from typing import Any
 
@@ -43,11 +43,17 @@ def get_stream_id(channel_id: str, stream_type: int = 1) -> int:
     return int(channel_id) * 100 + stream_type
 
 
+@lru_cache(maxsize=256)
+def _path_keys(path: str) -> tuple[str, ...]:
+    """Split dotted path into keys, compiled once per path literal."""
+    return tuple(path.split("."))
+
+
 def deep_get(dictionary: dict, path: str, default: Any = None) -> Any:
     """Get safely nested dictionary attribute."""
     result = reduce(
         lambda d, key: d.get(key, default) if isinstance(d, dict) else default,
-        path.split("."),
+        _path_keys(path),
         dictionary,
     )
     if default == [] and not isinstance(result, list):
@@ -2,44 +2,73 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import lru_cache
+import heapq
 from http import HTTPStatus
 import ipaddress
 import logging
 import socket
+import sys
 from urllib.parse import urlparse
 
 from aiohttp import web
 from requests_toolbelt.multipart import MultipartDecoder
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.const import CONTENT_TYPE_TEXT_PLAIN, STATE_OFF, STATE_ON, Platform
+from homeassistant.const import CONTENT_TYPE_TEXT_PLAIN, STATE_ON, Platform
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import async_get
-from homeassistant.helpers.event import async_call_later
-from homeassistant.util import slugify
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
 
-from .const import ALARM_SERVER_PATH, DOMAIN, EVENT_AUTO_RESET_TIMEOUT, HIKVISION_EVENT
+from .const import ALARM_SERVER_PATH, DOMAIN, EVENT_AUTO_RESET_TIMEOUT, EVENTS, HIKVISION_EVENT, SIGNAL_EVENT_STATE
 from .hikvision_device import HikvisionDevice
-from .isapi import AlertInfo, IPCamera, ISAPIClient
-from .isapi.const import EVENT_IO, EVENT_VIDEOINTERCOM
+from .isapi import AlertInfo, ISAPIClient
+from .isapi.const import DEVICE_LEVEL_EVENT_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
-# Dictionary to track pending auto-reset timers by entity_id.
+# Auto-reset deadlines of binary sensors by entity_id.
 # This is module-level because there's only one EventNotificationsView instance
 # registered per Home Assistant instance, and timers need to persist across HTTP requests.
-_pending_resets: dict[str, CALLBACK_TYPE] = {}
+_pending_resets: dict[str, datetime] = {}
+# (deadline, entity_id, unique_id, entry_id) min-heap, entries superseded by a newer deadline are skipped when popped
+_reset_heap: list[tuple[datetime, str, str, str]] = []
+# Single timer armed for the earliest deadline in the heap
+_cancel_reset_timer: CALLBACK_TYPE | None = None
+
+AUTO_RESET_DELAY = timedelta(seconds=EVENT_AUTO_RESET_TIMEOUT)
 
 
 def cancel_all_pending_resets() -> None:
     """Cancel all pending auto-reset timers.
 
-    This is useful for cleanup during testing or when unloading the integration.
+    This is useful for cleanup during testing, config entries drop their own resets on unload.
     """
-    for cancel_callback in list(_pending_resets.values()):
-        cancel_callback()
+    global _cancel_reset_timer
+    if _cancel_reset_timer:
+        _cancel_reset_timer()
+        _cancel_reset_timer = None
     _pending_resets.clear()
+    _reset_heap.clear()
+
+
+def cancel_entry_resets(entry_id: str) -> None:
+    """Drop pending auto-resets of an unloaded config entry, the timer is cancelled when nothing is left."""
+    global _cancel_reset_timer
+    dropped = {item[1] for item in _reset_heap if item[3] == entry_id}
+    if not dropped:
+        return
+    _reset_heap[:] = [item for item in _reset_heap if item[3] != entry_id]
+    heapq.heapify(_reset_heap)
+    for entity_id in dropped:
+        _pending_resets.pop(entity_id, None)
+    _drop_superseded_resets()
+    if not _reset_heap and _cancel_reset_timer:
+        _cancel_reset_timer()
+        _cancel_reset_timer = None
 
 
 def has_pending_reset(entity_id: str) -> bool:
@@ -51,6 +80,14 @@ def has_pending_reset(entity_id: str) -> bool:
     return entity_id in _pending_resets
 
 
+def pending_reset_ids() -> frozenset[str]:
+    """Get entity ids with a pending auto-reset timer in a single snapshot.
+
+    This is primarily useful for testing.
+    """
+    return frozenset(_pending_resets)
+
+
 def get_pending_resets_count() -> int:
     """Get the number of pending auto-reset timers.
 
@@ -59,11 +96,35 @@ def get_pending_resets_count() -> int:
     return len(_pending_resets)
 
 
+def _drop_superseded_resets() -> None:
+    """Pop heap entries whose deadline was moved by a newer event."""
+    while _reset_heap and _pending_resets.get(_reset_heap[0][1]) != _reset_heap[0][0]:
+        heapq.heappop(_reset_heap)
+
+
+@lru_cache(maxsize=1024)
+def get_binary_sensor_unique_id(serial_no_slug: str, channel_id: int, io_port_id: int, event_id: str) -> str:
+    """Get binary sensor unique id for alert, built once per device, channel, port and event."""
+    # Check event type - device-level events (IO and VideoIntercom) don't include channel_id
+    event_type = EVENTS.get(event_id, {}).get("type")
+    is_device_level_event = event_type in DEVICE_LEVEL_EVENT_TYPES
+    device_id_param = f"_{channel_id}" if channel_id != 0 and not is_device_level_event else ""
+    io_port_id_param = f"_{io_port_id}" if io_port_id != 0 else ""
+    return sys.intern(f"binary_sensor.{serial_no_slug}{device_id_param}{io_port_id_param}_{event_id}")
+
+
+# AlertInfo fields sent in every HIKVISION_EVENT
+EVENT_DATA_FIELDS = ("channel_id", "io_port_id", "event_id")
+# AlertInfo fields sent in HIKVISION_EVENT of alerts with detection target
+DETECTION_DATA_FIELDS = ("detection_target", "region_id")
+
 CONTENT_TYPE = "Content-Type"
-CONTENT_TYPE_XML = (
-    "application/xml",
-    'application/xml; charset="UTF-8"',
-    "text/xml",
+CONTENT_TYPE_XML = frozenset(
+    (
+        "application/xml",
+        'application/xml; charset="UTF-8"',
+        "text/xml",
+    )
 )
 CONTENT_TYPE_TEXT_HTML = "text/html"
 CONTENT_TYPE_IMAGE = "image/jpeg"
@@ -192,39 +253,28 @@ class EventNotificationsView(HomeAssistantView):
             # channel id above 32 is an IP camera
             # On DVRs that support analog cameras 33 may not be
             # camera 1 but camera 5 for example
-            try:
-                alert.channel_id = [
-                    camera.id
-                    for camera in self.device.cameras
-                    if isinstance(camera, IPCamera) and camera.input_port == alert.channel_id - 32
-                ][0]
-            except IndexError:
-                alert.channel_id = alert.channel_id - 32
+            input_port = alert.channel_id - 32
+            camera = self.device.ip_cameras_by_port.get(input_port)
+            alert.channel_id = camera.id if camera else input_port
 
     def trigger_sensor(self, alert: AlertInfo) -> None:
         """Determine entity and set binary sensor state."""
 
         _LOGGER.debug("Alert: %s", alert)
 
-        serial_no = self.device.device_info.serial_no.lower()
-
-        # Check event type - device-level events (IO and VideoIntercom) don't include channel_id
-        event_type = EVENTS.get(alert.event_id, {}).get("type")
-        is_device_level_event = event_type in (EVENT_IO, EVENT_VIDEOINTERCOM)
-        device_id_param = f"_{alert.channel_id}" if alert.channel_id != 0 and not is_device_level_event else ""
-        io_port_id_param = f"_{alert.io_port_id}" if alert.io_port_id != 0 else ""
-        unique_id = f"binary_sensor.{slugify(serial_no)}{device_id_param}{io_port_id_param}_{alert.event_id}"
+        unique_id = get_binary_sensor_unique_id(
+            self.device.serial_no_slug, alert.channel_id, alert.io_port_id, alert.event_id
+        )
 
         _LOGGER.debug("UNIQUE_ID: %s", unique_id)
 
         entity_registry = async_get(self.hass)
         entity_id = entity_registry.async_get_entity_id(Platform.BINARY_SENSOR, DOMAIN, unique_id)
         if entity_id:
-            entity = self.hass.states.get(entity_id)
-            if entity:
-                self.hass.states.async_set(entity_id, STATE_ON, entity.attributes)
+            if self.hass.states.get(entity_id):
+                async_dispatcher_send(self.hass, SIGNAL_EVENT_STATE.format(unique_id), True)
                 self.fire_hass_event(alert)
-                self.schedule_auto_reset(entity_id, entity.attributes)
+                self.schedule_auto_reset(entity_id, unique_id)
             return
         raise ValueError(f"Entity not found {entity_id}")
 
@@ -234,54 +284,64 @@ class EventNotificationsView(HomeAssistantView):
         if camera := self.device.get_camera_by_id(alert.channel_id):
             camera_name = camera.name
 
-        message = {
-            "channel_id": alert.channel_id,
-            "io_port_id": alert.io_port_id,
-            "camera_name": camera_name,
-            "event_id": alert.event_id,
-        }
+        message = {field: getattr(alert, field) for field in EVENT_DATA_FIELDS}
+        message["camera_name"] = camera_name
         if alert.detection_target:
-            message["detection_target"] = alert.detection_target
-            message["region_id"] = alert.region_id
+            # optional fields are sent only for alerts with detection target
+            for field in DETECTION_DATA_FIELDS:
+                message[field] = getattr(alert, field)
 
-        self.hass.bus.fire(
+        self.hass.bus.async_fire(
             HIKVISION_EVENT,
             message,
         )
 
-    def schedule_auto_reset(self, entity_id: str, attributes: dict) -> None:
+    def schedule_auto_reset(self, entity_id: str, unique_id: str) -> None:
         """Schedule auto-reset of sensor state after timeout.
 
         If an event notification is received and no subsequent events arrive within
         EVENT_AUTO_RESET_TIMEOUT seconds, the sensor will automatically reset to OFF.
         This prevents sensors from getting "stuck" in the ON state if the "inactive"
         event packet is dropped.
+
+        A new event only moves the entity deadline, the previous heap entry becomes stale
+        and no timer is cancelled or created while the reset timer is already armed.
         """
 
-        # Cancel any existing pending reset for this entity
         if entity_id in _pending_resets:
-            _pending_resets[entity_id]()
-            _LOGGER.debug("Cancelled existing auto-reset timer for %s", entity_id)
+            _LOGGER.debug("Postponed existing auto-reset for %s", entity_id)
 
-        @callback
-        def reset_sensor(_now) -> None:
-            """Reset sensor to OFF state."""
-            _LOGGER.debug("Auto-reset timer expired for %s, resetting to OFF", entity_id)
-            entity = self.hass.states.get(entity_id)
-            if entity and entity.state == STATE_ON:
-                self.hass.states.async_set(entity_id, STATE_OFF, attributes)
-            # Clean up the pending reset entry
-            _pending_resets.pop(entity_id, None)
-
-        # Schedule the auto-reset
-        cancel_callback = async_call_later(
-            self.hass,
-            timedelta(seconds=EVENT_AUTO_RESET_TIMEOUT),
-            reset_sensor,
-        )
-        _pending_resets[entity_id] = cancel_callback
+        deadline = dt_util.utcnow() + AUTO_RESET_DELAY
+        _pending_resets[entity_id] = deadline
+        heapq.heappush(_reset_heap, (deadline, entity_id, unique_id, self.device.entry.entry_id))
+        if _cancel_reset_timer is None:
+            self._arm_reset_timer()
         _LOGGER.debug(
-            "Scheduled auto-reset timer for %s in %s seconds",
+            "Scheduled auto-reset for %s in %s seconds",
             entity_id,
             EVENT_AUTO_RESET_TIMEOUT,
         )
+
+    def _arm_reset_timer(self) -> None:
+        """Arm the reset timer for the earliest pending deadline."""
+        global _cancel_reset_timer
+        _drop_superseded_resets()
+        if _reset_heap:
+            _cancel_reset_timer = async_track_point_in_utc_time(self.hass, self._async_reset_expired, _reset_heap[0][0])
+
+    @callback
+    def _async_reset_expired(self, now: datetime) -> None:
+        """Reset sensors whose deadline expired to OFF state."""
+        global _cancel_reset_timer
+        _cancel_reset_timer = None
+        while _reset_heap and _reset_heap[0][0] <= now:
+            deadline, entity_id, unique_id, _ = heapq.heappop(_reset_heap)
+            if _pending_resets.get(entity_id) != deadline:
+                # superseded by a newer event
+                continue
+            del _pending_resets[entity_id]
+            _LOGGER.debug("Auto-reset timer expired for %s, resetting to OFF", entity_id)
+            entity = self.hass.states.get(entity_id)
+            if entity and entity.state == STATE_ON:
+                async_dispatcher_send(self.hass, SIGNAL_EVENT_STATE.format(unique_id), False)
+        self._arm_reset_timer()
@@ -1,6 +1,14 @@
-from httpx import HTTPStatusError
+"""Hikvision integration actions."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
 import voluptuous as vol
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
@@ -8,6 +16,7 @@ from homeassistant.core import (
     SupportsResponse,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     ACTION_ISAPI_REQUEST,
@@ -22,28 +31,78 @@ from .const import (
     ATTR_CONFIG_ENTRY_ID,
     DOMAIN,
 )
-from .isapi import (
-    ISAPIActiveDeterrenceNotSupportedError,
-    ISAPIForbiddenError,
-    ISAPIUnauthorizedError,
-)
+from .hikvision_device import HikvisionDevice
+from .isapi import ISAPIActiveDeterrenceNotSupportedError, ISAPIRequestError
+from .isapi.const import STROBE_FREQUENCIES
+
+# Translation table deleting carriage returns from ISAPI responses
+_CR_STRIP = str.maketrans("", "", "\r")
+
+# Devices resolved from config entry ids, evicted when the config entry is unloaded
+_ENTRY_CACHE: dict[str, HikvisionDevice] = {}
+
+
+def _int_range(minimum: int, maximum: int) -> Callable[[Any], int]:
+    """Return validator coercing value to int within inclusive range in a single call."""
+
+    def validate(value: Any) -> int:
+        try:
+            number = int(value)
+        except (TypeError, ValueError) as ex:
+            raise vol.CoerceInvalid("expected int") from ex
+        if not minimum <= number <= maximum:
+            raise vol.RangeInvalid(f"value must be between {minimum} and {maximum}")
+        return number
+
+    return validate
+
+
+def _isapi_path(value: Any) -> str:
+    """Validate ISAPI path, normalized relative to ISAPI prefix once at validation."""
+    return cv.string(value).strip("/")
+
 
-ACTION_ISAPI_REQUEST_SCHEMA = vol.Schema(
+# Validators shared by active deterrence schemas
+_DURATION = _int_range(1, 300)
+_VOLUME = _int_range(1, 100)
+_ALARM_TIMES = _int_range(1, 10)
+_FREQUENCY = vol.In(STROBE_FREQUENCIES)
+
+
+ACTION_REBOOT_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+
+ISAPI_REQUEST_ITEM_SCHEMA = vol.Schema(
+    {
         vol.Required("method"): str,
-        vol.Required("path"): str,
-        vol.Optional("payload"): str,
+        vol.Required("path"): _isapi_path,
+        vol.Optional("payload", default=None): vol.Maybe(str),
     }
 )
 
+ACTION_ISAPI_REQUEST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+            vol.Optional("method", default="GET"): str,
+            vol.Exclusive("path", "request"): _isapi_path,
+            vol.Optional("payload", default=None): vol.Maybe(str),
+            vol.Exclusive("requests", "request"): vol.All(cv.ensure_list, [ISAPI_REQUEST_ITEM_SCHEMA]),
+        }
+    ),
+    cv.has_at_least_one_key("path", "requests"),
+)
+
 ACTION_TRIGGER_SIREN_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
-        vol.Optional("duration", default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+        vol.Optional("duration", default=10): _DURATION,
         vol.Optional("audio_id", default=1): vol.Coerce(int),
-        vol.Optional("volume", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
-        vol.Optional("alarm_times", default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+        vol.Optional("volume", default=50): _VOLUME,
+        vol.Optional("alarm_times", default=1): _ALARM_TIMES,
     }
 )
 
@@ -51,8 +110,8 @@ ACTION_TRIGGER_STROBE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
         vol.Optional("channel_id", default=1): vol.Coerce(int),
-        vol.Optional("duration", default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
-        vol.Optional("frequency", default="medium"): vol.In(["low", "medium", "high", "constant"]),
+        vol.Optional("duration", default=10): _DURATION,
+        vol.Optional("frequency", default="medium"): _FREQUENCY,
     }
 )
 
@@ -60,8 +119,8 @@ ACTION_PLAY_VOICE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
         vol.Optional("audio_id", default=1): vol.Coerce(int),
-        vol.Optional("volume", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
-        vol.Optional("alarm_times", default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+        vol.Optional("volume", default=50): _VOLUME,
+        vol.Optional("alarm_times", default=1): _ALARM_TIMES,
     }
 )
 
@@ -90,57 +149,162 @@ ACTION_PTZ_SET_PATROL_SCHEMA = vol.Schema(
 )
 
 
-def setup_services(hass: HomeAssistant) -> None:
-    """Set up the services for the Hikvision component."""
-
-    async def handle_reboot(call: ServiceCall):
-        """Handle the reboot action call."""
-        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+def get_device(hass: HomeAssistant, entry_id: str) -> HikvisionDevice:
+    """Get device for config entry id, cached for the lifetime of the loaded entry."""
+    device = _ENTRY_CACHE.get(entry_id)
+    if device is None:
         entry = hass.config_entries.async_get_entry(entry_id)
-        device = entry.runtime_data
-        try:
-            await device.reboot()
-        except (HTTPStatusError, ISAPIForbiddenError, ISAPIUnauthorizedError) as ex:
-            raise HomeAssistantError(ex.response.content) from ex
+        if not entry or entry.state is not ConfigEntryState.LOADED:
+            raise HomeAssistantError(f"Config entry {entry_id} is not loaded")
+        device = _ENTRY_CACHE[entry_id] = entry.runtime_data
+    return device
 
-    async def handle_isapi_request(call: ServiceCall) -> ServiceResponse:
-        """Handle the custom ISAPI request action call."""
-        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        entry = hass.config_entries.async_get_entry(entry_id)
-        device = entry.runtime_data
-        method = call.data.get("method", "POST")
-        path = call.data["path"].strip("/")
-        payload = call.data.get("payload")
-        try:
-            response = await device.request(method, path, present="xml", data=payload)
-        except (HTTPStatusError, ISAPIForbiddenError, ISAPIUnauthorizedError) as ex:
-            if isinstance(ex.response.content, bytes):
-                response = ex.response.content.decode("utf-8")
-            else:
-                response = ex.response.content
-        return {"data": response.replace("\r", "")}
-
-    async def handle_trigger_siren(call: ServiceCall) -> None:
-        """Handle the trigger siren action call."""
-        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        entry = hass.config_entries.async_get_entry(entry_id)
-        device = entry.runtime_data
-        duration = call.data.get("duration", 10)
-        audio_id = call.data.get("audio_id", 1)
-        volume = call.data.get("volume", 50)
-        alarm_times = call.data.get("alarm_times", 1)
+
+def _device(call: ServiceCall) -> HikvisionDevice:
+    """Get device for config entry of action call."""
+    return get_device(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+
+
+def clear_device_cache(entry_id: str) -> None:
+    """Remove cached device for unloaded config entry."""
+    _ENTRY_CACHE.pop(entry_id, None)
+
+
+def _isapi_action(
+    method: str,
+    keys: tuple[str, ...] = (),
+    requires: tuple[str, str] | None = None,
+) -> Callable[[ServiceCall], Awaitable[None]]:
+    """Build action handler calling device method with call data keys as kwargs.
+
+    :param requires: (capability attribute, error message) checked before calling the device
+    """
+
+    async def handle(call: ServiceCall) -> None:
+        device = _device(call)
+        if requires and not getattr(device.capabilities, requires[0]):
+            raise HomeAssistantError(requires[1])
+        kwargs = {key: call.data[key] for key in keys}
         try:
-            await device.trigger_siren(duration=duration, audio_id=audio_id, volume=volume, alarm_times=alarm_times)
+            await getattr(device, method)(**kwargs)
         except ISAPIActiveDeterrenceNotSupportedError as ex:
             raise HomeAssistantError(ex.message) from ex
-        except (HTTPStatusError, ISAPIForbiddenError, ISAPIUnauthorizedError) as ex:
-            raise HomeAssistantError(ex.response.content) from ex
+        except ISAPIRequestError as ex:
+            raise HomeAssistantError(ex.response.text) from ex
 
-    async def handle_trigger_strobe(call: ServiceCall) -> None:
-        """Handle the trigger strobe action call."""
-        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
-        entry = hass.config_entries.async_get_entry(entry_id)
-        device = entry.runtime_data
-        channel_id = call.data.get("channel_id", 1)
-        duration = call.data.get("duration", 10)
-        frequency = call.data.get("frequency", "medium")
\ No newline at end of file
+    return handle
+
+
+async def _isapi_request(device: HikvisionDevice, method: str, path: str, payload: str | None) -> str:
+    """Send custom ISAPI request, return response or error body."""
+    try:
+        response = await device.request(method, path, present="xml", data=payload)
+    except ISAPIRequestError as ex:
+        response = ex.response.text
+    return response.translate(_CR_STRIP) if "\r" in response else response
+
+
+def _request_error(ex: httpx.HTTPError) -> str:
+    """Describe error of a batched request not answered by the device."""
+    return f"{type(ex).__name__}: {ex}"
+
+
+async def _batch_item(device: HikvisionDevice, item: dict[str, Any]) -> dict[str, str]:
+    """Send one batched request, return {"response": body} or {"error": description}."""
+    try:
+        return {"response": await _isapi_request(device, item["method"], item["path"], item["payload"])}
+    except httpx.HTTPError as ex:
+        return {"error": _request_error(ex)}
+
+
+async def handle_isapi_request(call: ServiceCall) -> ServiceResponse:
+    """Handle the custom ISAPI request action call.
+
+    A list of requests is sent one by one in the given order, as later requests may depend
+    on device state changed by earlier ones. Each request gets {"response": body} with the device
+    reply, or {"error": description} when it failed on transport level, the remaining requests
+    are still sent.
+    """
+    device = _device(call)
+    if requests := call.data.get("requests"):
+        return {"data": [await _batch_item(device, item) for item in requests]}
+    response = await _isapi_request(
+        device,
+        call.data["method"],
+        call.data["path"],
+        call.data["payload"],
+    )
+    return {"data": response}
+
+
+# (capability, error message) checked in action handler before any device request
+TWO_WAY_AUDIO_REQUIRED = ("support_two_way_audio", "Device does not support two-way audio")
+SIREN_REQUIRED = ("support_siren", ISAPIActiveDeterrenceNotSupportedError("siren").message)
+STROBE_REQUIRED = ("support_strobe", ISAPIActiveDeterrenceNotSupportedError("strobe").message)
+VOICE_REQUIRED = ("support_voice", ISAPIActiveDeterrenceNotSupportedError("voice").message)
+
+
+def setup_services(hass: HomeAssistant) -> None:
+    """Set up the services for the Hikvision component."""
+
+    if hass.services.has_service(DOMAIN, ACTION_REBOOT):
+        # actions are registered once for all config entries
+        return
+
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_REBOOT,
+        _isapi_action("reboot"),
+        schema=ACTION_REBOOT_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_ISAPI_REQUEST,
+        handle_isapi_request,
+        schema=ACTION_ISAPI_REQUEST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_TRIGGER_SIREN,
+        _isapi_action(
+            "trigger_siren", ("duration", "audio_id", "volume", "alarm_times"), requires=SIREN_REQUIRED
+        ),
+        schema=ACTION_TRIGGER_SIREN_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_TRIGGER_STROBE,
+        _isapi_action("trigger_strobe", ("channel_id", "duration", "frequency"), requires=STROBE_REQUIRED),
+        schema=ACTION_TRIGGER_STROBE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_PLAY_VOICE,
+        _isapi_action("play_voice", ("audio_id", "volume", "alarm_times"), requires=VOICE_REQUIRED),
+        schema=ACTION_PLAY_VOICE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_START_TWO_WAY_AUDIO,
+        _isapi_action("start_two_way_audio", ("channel_id",), requires=TWO_WAY_AUDIO_REQUIRED),
+        schema=ACTION_TWO_WAY_AUDIO_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_STOP_TWO_WAY_AUDIO,
+        _isapi_action("stop_two_way_audio", ("channel_id",), requires=TWO_WAY_AUDIO_REQUIRED),
+        schema=ACTION_TWO_WAY_AUDIO_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_PTZ_GOTO_PRESET,
+        _isapi_action("ptz_goto_preset", ("channel_id", "preset_id")),
+        schema=ACTION_PTZ_GOTO_PRESET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        ACTION_PTZ_SET_PATROL,
+        _isapi_action("ptz_set_patrol", ("channel_id", "patrol_id", "enabled")),
+        schema=ACTION_PTZ_SET_PATROL_SCHEMA,
+    )
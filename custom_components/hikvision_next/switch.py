@@ -9,7 +9,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import slugify
 
 from . import HikvisionConfigEntry
 from .const import EVENTS_COORDINATOR, HOLIDAY_MODE, SECONDARY_COORDINATOR
@@ -50,6 +49,11 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def set_optimistic_state(coordinator, key: str, state: bool) -> None:
+    """Set state confirmed by device in coordinator data, instead of polling all states again."""
+    coordinator.async_set_updated_data({**coordinator.data, key: state})
+
+
 class EventSwitch(CoordinatorEntity, SwitchEntity):
     """Detection events switch."""
 
@@ -79,20 +83,21 @@ class EventSwitch(CoordinatorEntity, SwitchEntity):
         try:
             await self.coordinator.device.set_event_enabled_state(self.device_id, self.event, True)
         except ISAPISetEventStateMutexError as ex:
+            await self.coordinator.async_request_refresh()
             raise HomeAssistantError(ex.message)
-        except Exception as ex:
-            raise ex
-        finally:
+        except Exception:
             await self.coordinator.async_request_refresh()
+            raise
+        set_optimistic_state(self.coordinator, self.unique_id, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off."""
         try:
             await self.coordinator.device.set_event_enabled_state(self.device_id, self.event, False)
         except Exception:
-            raise
-        finally:
             await self.coordinator.async_request_refresh()
+            raise
+        set_optimistic_state(self.coordinator, self.unique_id, False)
 
 
 class NVROutputSwitch(CoordinatorEntity, SwitchEntity):
@@ -106,7 +111,7 @@ class NVROutputSwitch(CoordinatorEntity, SwitchEntity):
         """Initialize."""
         super().__init__(coordinator)
         self.entity_id = ENTITY_ID_FORMAT.format(
-            f"{slugify(coordinator.device.device_info.serial_no.lower())}_{port_no}_alarm_output"
+            f"{coordinator.device.serial_no_slug}_{port_no}_alarm_output"
         )
         self._attr_unique_id = self.entity_id
         self._attr_device_info = coordinator.device.hass_device_info(0)
@@ -122,18 +127,18 @@ class NVROutputSwitch(CoordinatorEntity, SwitchEntity):
         """Turn on."""
         try:
             await self.coordinator.device.set_output_port_state(self._port_no, True)
-        except Exception as ex:
-            raise ex
-        finally:
+        except Exception:
             await self.coordinator.async_request_refresh()
+            raise
+        set_optimistic_state(self.coordinator, self.unique_id, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         try:
             await self.coordinator.device.set_output_port_state(self._port_no, False)
-        except Exception as ex:
-            raise ex
-        finally:
+        except Exception:
             await self.coordinator.async_request_refresh()
+            raise
+        set_optimistic_state(self.coordinator, self.unique_id, False)
 
 
 class HolidaySwitch(CoordinatorEntity, SwitchEntity):
@@ -146,7 +151,7 @@ class HolidaySwitch(CoordinatorEntity, SwitchEntity):
     def __init__(self, coordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{slugify(coordinator.device.device_info.serial_no.lower())}_{HOLIDAY_MODE}"
+        self._attr_unique_id = f"{coordinator.device.serial_no_slug}_{HOLIDAY_MODE}"
         self.entity_id = ENTITY_ID_FORMAT.format(self.unique_id)
         self._attr_device_info = coordinator.device.hass_device_info()
 
@@ -158,9 +163,9 @@ class HolidaySwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on."""
         await self.coordinator.device.set_holiday_enabled_state(True)
-        await self.coordinator.async_request_refresh()
+        set_optimistic_state(self.coordinator, HOLIDAY_MODE, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off."""
         await self.coordinator.device.set_holiday_enabled_state(False)
-        await self.coordinator.async_request_refresh()
+        set_optimistic_state(self.coordinator, HOLIDAY_MODE, False)
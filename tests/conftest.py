@@ -1,15 +1,23 @@
 """Fixtures for testing."""
 
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache, partial
 import json
+from pathlib import Path
+from types import MappingProxyType
+import httpx
 import pytest
 import respx
 import xmltodict
-from custom_components.hikvision_next.const import DOMAIN, CONF_SET_ALARM_SERVER, CONF_ALARM_SERVER_HOST, RTSP_PORT_FORCED
-from custom_components.hikvision_next.notifications import cancel_all_pending_resets
+from custom_components.hikvision_next.const import HIKVISION_EVENT, DOMAIN, CONF_SET_ALARM_SERVER, CONF_ALARM_SERVER_HOST, RTSP_PORT_FORCED
+from custom_components.hikvision_next.notifications import EventNotificationsView, cancel_all_pending_resets
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, CONF_VERIFY_SSL
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 from custom_components.hikvision_next.isapi import ISAPIClient
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 
 TEST_HOST_IP = "1.0.0.255"
 TEST_HOST = f"http://{TEST_HOST_IP}"
@@ -32,6 +40,42 @@ TEST_CONFIG_OUTSIDE_NETWORK = {
     RTSP_PORT_FORCED: 5151,
 }
 
+# Read-only headers shared by all mocked event notification requests
+EVENT_NOTIFICATION_HEADERS = MappingProxyType({
+    "Content-Type": 'application/xml; charset="UTF-8"',
+})
+
+
+@dataclass(slots=True, frozen=True)
+class MockEventRequest:
+    """Incoming event notification request with only the attributes read by the view."""
+
+    headers: Mapping[str, str]
+    remote: str
+    body: asyncio.Future[bytes]
+
+    def read(self) -> asyncio.Future[bytes]:
+        """Return the already resolved payload, awaiting it needs no coroutine."""
+        return self.body
+
+
+async def advance_and_settle(hass: HomeAssistant, freezer, seconds: float) -> None:
+    """Advance frozen time, fire due time listeners once and wait for the resulting state changes.
+
+    Advance past all deadlines of a test at once, so a single pass resets every sensor.
+    """
+    freezer.tick(timedelta(seconds=seconds))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+def assert_state(hass: HomeAssistant, entity_id: str, expected: str) -> State:
+    """Assert entity exists and is in expected state."""
+    state = hass.states.get(entity_id)
+    assert state is not None, f"{entity_id} not found"
+    assert state.state == expected
+    return state
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
@@ -45,6 +89,26 @@ def cleanup_pending_resets():
     cancel_all_pending_resets()
 
 
+@pytest.fixture
+def event_view(hass: HomeAssistant) -> EventNotificationsView:
+    """Return event notifications view shared by all notifications posted in a test."""
+    return EventNotificationsView(hass)
+
+
+@callback
+def _append_bus_event(bus_events: list[Event], event: Event) -> None:
+    """Append bus event to the collected events."""
+    bus_events.append(event)
+
+
+def setup_bus_event_listener(hass: HomeAssistant, event_filter=None) -> list[Event]:
+    """Collect hikvision events fired on the bus, optionally filtered by event data."""
+    bus_events = []
+    # job type is resolved from the function wrapped by the partial, so the listener runs in the event loop
+    hass.bus.async_listen(HIKVISION_EVENT, partial(_append_bus_event, bus_events), event_filter=event_filter)
+    return bus_events
+
+
 @pytest.fixture
 def mock_config_entry(request) -> MockConfigEntry:
     """Return the default mocked config entry."""
@@ -57,39 +121,81 @@ def mock_config_entry(request) -> MockConfigEntry:
     )
 
 
+# Event notification payloads by fixture name, read once when the test session starts
+EVENT_FIXTURES: dict[str, bytes] = {}
+
+
+def pytest_configure(config):
+    """Preload event notification fixtures."""
+    for path in Path("tests/fixtures/ISAPI/EventNotificationAlert").glob("*.xml"):
+        EVENT_FIXTURES[path.stem] = path.read_bytes()
+
+
+def mock_event_notification(file) -> MockEventRequest:
+    """Mock incoming event notification request, to be called from the running event loop."""
+    body = asyncio.get_running_loop().create_future()
+    body.set_result(EVENT_FIXTURES[file])
+    return MockEventRequest(EVENT_NOTIFICATION_HEADERS, TEST_HOST_IP, body)
+
+
+@lru_cache(maxsize=None)
 def load_fixture(path, file):
+    """Load XML fixture, read from disk only once per test session."""
     with open(f"tests/fixtures/{path}/{file}.xml", "r") as f:
         return f.read()
 
 
+@lru_cache(maxsize=None)
+def load_fixture_bytes(path, file):
+    """Load XML fixture as bytes, e.g. for response content or request body comparison."""
+    return Path(f"tests/fixtures/{path}/{file}.xml").read_bytes()
+
+
+@lru_cache(maxsize=None)
+def status_response(status_code: int) -> httpx.Response:
+    """Return empty response with status code, shared by all routes mocking it."""
+    return httpx.Response(status_code)
+
+
 def mock_endpoint(endpoint, file=None, status_code=200):
     """Mock ISAPI endpoint."""
 
     url = f"{TEST_HOST}/ISAPI/{endpoint}"
     path = f"ISAPI/{endpoint.replace('/', '.')}"
     if not file:
-        return respx.get(url).respond(status_code=status_code)
-    return respx.get(url).respond(text=load_fixture(path, file))
+        return respx.get(url).mock(return_value=status_response(status_code))
+    return respx.get(url).respond(content=load_fixture_bytes(path, file))
 
 
-def mock_device_endpoints(model, device_url=TEST_HOST):
-    """Mock all ISAPI requests used for device initialization."""
+@lru_cache(maxsize=None)
+def load_device_responses(model) -> tuple[tuple[str, int | None, bytes | None], ...]:
+    """Load (endpoint, status code, encoded xml) of device ISAPI responses, parsed once per model."""
 
-    f = open(f"tests/fixtures/devices/{model}.json", "r")
-    diagnostics = json.load(f)
-    f.close()
+    with open(f"tests/fixtures/devices/{model}.json", "r") as f:
+        diagnostics = json.load(f)
+    responses = []
     for endpoint, data in diagnostics["data"]["ISAPI"].items():
-        url = f"{device_url}/ISAPI/{endpoint}"
         if status_code := data.get("status_code"):
-            respx.get(url).respond(status_code=status_code)
+            responses.append((endpoint, status_code, None))
         elif response := data.get("response"):
-            xml = xmltodict.unparse(response)
-            respx.get(url).respond(text=xml)
+            responses.append((endpoint, None, xmltodict.unparse(response).encode()))
+    return tuple(responses)
+
+
+def mock_device_endpoints(model, device_url=TEST_HOST):
+    """Mock all ISAPI requests used for device initialization."""
+
+    for endpoint, status_code, xml in load_device_responses(model):
+        url = f"{device_url}/ISAPI/{endpoint}"
+        if status_code:
+            respx.get(url).mock(return_value=status_response(status_code))
+        else:
+            respx.get(url).respond(content=xml)
 
 
 @pytest.fixture
-def mock_isapi(respx_mock, request):
-    """Mock ISAPI instance."""
+async def mock_isapi(respx_mock, request):
+    """Mock ISAPI instance, its HTTP session is closed after the test."""
 
     device_url = getattr(request, "param", TEST_HOST)
     digest_header = 'Digest realm="testrealm", qop="auth", nonce="dcd98b7102dd2f0e8b11d0f600bfb0c093", opaque="799d5"'
@@ -97,7 +203,8 @@ def mock_isapi(respx_mock, request):
         status_code=401, headers={"WWW-Authenticate": digest_header}
     )
     isapi = ISAPIClient(**TEST_CLIENT)
-    return isapi
+    yield isapi
+    await isapi.aclose()
 
 
 @pytest.fixture
@@ -129,6 +236,21 @@ async def init_integration(respx_mock, request, mock_isapi, hass: HomeAssistant,
         model = request.param[0]
         skip_setup = request.param[1]
 
+    return await setup_integration(hass, mock_config_entry, model, skip_setup)
+
+
+@pytest.fixture
+async def doorbell_integration(respx_mock, mock_isapi, hass: HomeAssistant, mock_config_entry: MockConfigEntry):
+    """Mock integration of DS-KV8113-WME1 video intercom doorbell."""
+
+    return await setup_integration(hass, mock_config_entry, "DS-KV8113-WME1")
+
+
+async def setup_integration(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, model: str, skip_setup: bool = False
+) -> MockConfigEntry:
+    """Mock device endpoints of the model and set up the integration."""
+
     mock_device_endpoints(model, mock_config_entry.data[CONF_HOST])
 
     mock_config_entry.add_to_hass(hass)
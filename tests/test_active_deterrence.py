@@ -15,7 +15,9 @@ from custom_components.hikvision_next.const import (
     DOMAIN,
 )
 from custom_components.hikvision_next.isapi import ISAPIActiveDeterrenceNotSupportedError
-from tests.conftest import TEST_HOST
+from tests.conftest import TEST_HOST, status_response
+
+SIREN_ENABLED_RESPONSE = httpx.Response(200, content=b"<AudioAlarm><enabled>true</enabled></AudioAlarm>")
 
 
 @respx.mock
@@ -509,7 +511,7 @@ class TestActiveDeterrenceISAPIMethods:
 
         url = f"{isapi.host}/ISAPI/Event/triggers/notifications/AudioAlarm?format=json"
         # ISAPI returns XML which gets parsed to dict, return valid XML response
-        respx.get(url).respond(text='<AudioAlarm><enabled>true</enabled></AudioAlarm>')
+        respx.get(url).mock(return_value=SIREN_ENABLED_RESPONSE)
 
         result = await isapi._check_siren_support()
         assert result is True
@@ -520,7 +522,7 @@ class TestActiveDeterrenceISAPIMethods:
         isapi = mock_isapi
 
         url = f"{isapi.host}/ISAPI/Event/triggers/notifications/AudioAlarm?format=json"
-        respx.get(url).respond(status_code=404)
+        respx.get(url).mock(return_value=status_response(404))
 
         result = await isapi._check_siren_support()
         assert result is False
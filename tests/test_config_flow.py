@@ -7,7 +7,7 @@ from custom_components.hikvision_next.const import DOMAIN
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.config_entries import SOURCE_USER, ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, CONF_VERIFY_SSL
-from tests.conftest import TEST_CONFIG, TEST_HOST, TEST_CONFIG_OUTSIDE_NETWORK, load_fixture, mock_endpoint
+from tests.conftest import TEST_CONFIG, TEST_HOST, TEST_CONFIG_OUTSIDE_NETWORK, load_fixture_bytes, mock_endpoint
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -137,7 +137,7 @@ async def test_reconfiguration(hass: HomeAssistant, init_integration: MockConfig
     TEST_HOST2 = "https://1.0.0.100"
     url = f"{TEST_HOST2}/ISAPI/System/deviceInfo"
     path = "ISAPI/System.deviceInfo"
-    respx.get(url).respond(text=load_fixture(path, "ipc1"))
+    respx.get(url).respond(content=load_fixture_bytes(path, "ipc1"))
 
     result = await entry.start_reconfigure_flow(hass)
 
@@ -0,0 +1,48 @@
+"""Tests for coordinators."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import respx
+
+from custom_components.hikvision_next.coordinator import MAX_CONCURRENT_REQUESTS, gather_requests
+from custom_components.hikvision_next.isapi.const import GET
+from tests.conftest import TEST_HOST
+
+
+async def test_gather_requests_concurrency_limit() -> None:
+    """Test that no more than MAX_CONCURRENT_REQUESTS requests are in flight at once."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request(value: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return value
+
+    requests = {f"key_{i}": (request(i), f"details {i}") for i in range(MAX_CONCURRENT_REQUESTS * 4)}
+    device = MagicMock()
+
+    data = await gather_requests(device, requests)
+
+    assert max_in_flight == MAX_CONCURRENT_REQUESTS
+    assert data == {f"key_{i}": i for i in range(MAX_CONCURRENT_REQUESTS * 4)}
+    device.handle_exception.assert_not_called()
+
+
+async def test_gather_requests_detects_auth_once(mock_isapi) -> None:
+    """Test that concurrent requests share a single authentication method detection."""
+
+    respx.get(f"{TEST_HOST}/ISAPI/System/time").mock(return_value=httpx.Response(200, content=b"<Time/>"))
+    requests = {f"key_{i}": (mock_isapi.request(GET, "System/time"), f"details {i}") for i in range(3)}
+
+    data = await gather_requests(MagicMock(), requests)
+
+    assert len(data) == 3
+    auth_probes = [call for call in respx.calls if call.request.url.path == "/ISAPI/System/deviceInfo"]
+    assert len(auth_probes) == 1
@@ -2,21 +2,27 @@
 
 import pytest
 from http import HTTPStatus
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import STATE_ON, STATE_OFF
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hikvision_next.notifications import EventNotificationsView
-from custom_components.hikvision_next.const import HIKVISION_EVENT
-from tests.test_notifications import mock_event_notification
+from tests.conftest import assert_state, mock_event_notification, setup_bus_event_listener
+
+DOORBELL_ENTITY_ID = "binary_sensor.ds_kv8113_wme100000000aawrdb0000000_videointercomevent"
+
+
+@callback
+def intercom_filter(event_data) -> bool:
+    """Accept only doorbell bus events."""
+    return event_data["event_id"] == "videointercomevent"
 
 
-@pytest.mark.parametrize("init_integration", ["DS-KV8113-WME1"], indirect=True)
 async def test_doorbell_device_initialization(
-    hass: HomeAssistant, init_integration: MockConfigEntry,
+    hass: HomeAssistant, doorbell_integration: MockConfigEntry,
 ) -> None:
     """Test that doorbell device initializes correctly with videointercom event."""
-    device = init_integration.runtime_data
+    device = doorbell_integration.runtime_data
 
     # Verify device is identified as supporting video intercom
     assert device.capabilities.support_video_intercom is True
@@ -26,67 +32,75 @@ async def test_doorbell_device_initialization(
     assert "videointercomevent" in event_ids
 
     # Verify the doorbell binary sensor entity exists
-    entity_id = "binary_sensor.ds_kv8113_wme100000000aawrdb0000000_videointercomevent"
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, DOORBELL_ENTITY_ID, STATE_OFF)
+
+
+async def test_doorbell_event_url(
+    hass: HomeAssistant, doorbell_integration: MockConfigEntry,
+) -> None:
+    """Test that the doorbell event URL is correctly generated."""
+    device = doorbell_integration.runtime_data
+
+    # Find the videointercomevent
+    doorbell_events = [e for e in device.supported_events if e.id == "videointercomevent"]
+    assert len(doorbell_events) == 1
+    doorbell_event = doorbell_events[0]
+
+    # Verify the URL points to VideoIntercom/callStatus
+    assert doorbell_event.url == "VideoIntercom/callStatus"
+
+
+async def test_doorbell_motion_and_intercom_events(
+    hass: HomeAssistant, doorbell_integration: MockConfigEntry,
+) -> None:
+    """Test that doorbell has both motion detection and video intercom events."""
+    device = doorbell_integration.runtime_data
+
+    event_ids = [event.id for event in device.supported_events]
+
+    # Doorbell should have both motion detection and videointercom events
+    assert "motiondetection" in event_ids
+    assert "videointercomevent" in event_ids
 
 
-@pytest.mark.parametrize("init_integration", ["DS-KV8113-WME1"], indirect=True)
 async def test_doorbell_event_notification(
-    hass: HomeAssistant, init_integration: MockConfigEntry,
+    hass: HomeAssistant, doorbell_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test doorbell event notification triggers the binary sensor."""
-    entity_id = "binary_sensor.ds_kv8113_wme100000000aawrdb0000000_videointercomevent"
-    bus_events = []
-
-    def bus_event_listener(event: Event) -> None:
-        bus_events.append(event)
 
-    hass.bus.async_listen(HIKVISION_EVENT, bus_event_listener)
+    bus_events = setup_bus_event_listener(hass, intercom_filter)
 
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, DOORBELL_ENTITY_ID, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("doorbell_videointercomevent")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, DOORBELL_ENTITY_ID, STATE_ON)
 
-    await hass.async_block_till_done()
     assert len(bus_events) == 1
     data = bus_events[0].data
     assert data["channel_id"] == 1
     assert data["event_id"] == "videointercomevent"
 
 
-@pytest.mark.parametrize("init_integration", ["DS-KV8113-WME1"], indirect=True)
 async def test_doorbell_alternate_event_notification(
-    hass: HomeAssistant, init_integration: MockConfigEntry,
+    hass: HomeAssistant, doorbell_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test alternate doorbell event name (doorbellpress) triggers the binary sensor."""
-    entity_id = "binary_sensor.ds_kv8113_wme100000000aawrdb0000000_videointercomevent"
-    bus_events = []
-
-    def bus_event_listener(event: Event) -> None:
-        bus_events.append(event)
 
-    hass.bus.async_listen(HIKVISION_EVENT, bus_event_listener)
+    bus_events = setup_bus_event_listener(hass, intercom_filter)
 
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, DOORBELL_ENTITY_ID, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("doorbell_doorbellpress")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, DOORBELL_ENTITY_ID, STATE_ON)
 
-    await hass.async_block_till_done()
     assert len(bus_events) == 1
     data = bus_events[0].data
     # The event ID should be translated to videointercomevent
@@ -110,33 +124,3 @@ async def test_non_doorbell_device_no_videointercom_event(
     # Verify the doorbell binary sensor entity does not exist
     entity_id = "binary_sensor.ds_2cd2386g2_iu00000000aawrj00000000_videointercomevent"
     assert hass.states.get(entity_id) is None
-
-
-@pytest.mark.parametrize("init_integration", ["DS-KV8113-WME1"], indirect=True)
-async def test_doorbell_event_url(
-    hass: HomeAssistant, init_integration: MockConfigEntry,
-) -> None:
-    """Test that the doorbell event URL is correctly generated."""
-    device = init_integration.runtime_data
-
-    # Find the videointercomevent
-    doorbell_events = [e for e in device.supported_events if e.id == "videointercomevent"]
-    assert len(doorbell_events) == 1
-    doorbell_event = doorbell_events[0]
-
-    # Verify the URL points to VideoIntercom/callStatus
-    assert doorbell_event.url == "VideoIntercom/callStatus"
-
-
-@pytest.mark.parametrize("init_integration", ["DS-KV8113-WME1"], indirect=True)
-async def test_doorbell_motion_and_intercom_events(
-    hass: HomeAssistant, init_integration: MockConfigEntry,
-) -> None:
-    """Test that doorbell has both motion detection and video intercom events."""
-    device = init_integration.runtime_data
-
-    event_ids = [event.id for event in device.supported_events]
-
-    # Doorbell should have both motion detection and videointercom events
-    assert "motiondetection" in event_ids
-    assert "videointercomevent" in event_ids
@@ -4,26 +4,27 @@ import respx
 import httpx
 from contextlib import suppress
 from custom_components.hikvision_next.isapi import StorageInfo
-from tests.conftest import mock_endpoint, load_fixture
+from tests.conftest import mock_endpoint, load_fixture_bytes
+
+EXPECTED_HDD1 = StorageInfo(
+    id=1,
+    name="hdd1",
+    type="SATA",
+    status="ok",
+    capacity=1907729,
+    freespace=0,
+    property="RW",
+    ip="",
+)
 
 
-@respx.mock
 async def test_storage(mock_isapi):
     isapi = mock_isapi
 
     mock_endpoint("ContentMgmt/Storage", "hdd1")
     storage_list = await isapi.get_storage_devices()
     assert len(storage_list) == 1
-    assert storage_list[0] == StorageInfo(
-        id=1,
-        name="hdd1",
-        type="SATA",
-        status="ok",
-        capacity=1907729,
-        freespace=0,
-        property="RW",
-        ip="",
-    )
+    assert storage_list[0] == EXPECTED_HDD1
 
     mock_endpoint("ContentMgmt/Storage", "hdd1_nas1")
     storage_list = await isapi.get_storage_devices()
@@ -38,7 +39,6 @@ async def test_storage(mock_isapi):
         assert len(storage_list) == 0
 
 
-@respx.mock
 async def test_notification_hosts(mock_isapi):
     isapi = mock_isapi
 
@@ -51,13 +51,12 @@ async def test_notification_hosts(mock_isapi):
     assert host_nvr == host_ipc
 
 
-@respx.mock
 async def test_update_notification_hosts(mock_isapi):
     isapi = mock_isapi
 
     def update_side_effect(request, route):
-        payload = load_fixture("ISAPI/Event.notification.httpHosts", "set_alarm_server_payload")
-        if request.content.decode("utf-8") != payload:
+        payload = load_fixture_bytes("ISAPI/Event.notification.httpHosts", "set_alarm_server_payload")
+        if request.content != payload:
             raise AssertionError("Request content does not match expected payload")
         return httpx.Response(200)
 
@@ -69,13 +68,12 @@ async def test_update_notification_hosts(mock_isapi):
     assert endpoint.called
 
 
-@respx.mock
 async def test_update_notification_hosts_from_ipaddress_to_hostname(mock_isapi):
     isapi = mock_isapi
 
     def update_side_effect(request, route):
-        payload = load_fixture("ISAPI/Event.notification.httpHosts", "set_alarm_server_outside_network_payload")
-        if request.content.decode("utf-8") != payload:
+        payload = load_fixture_bytes("ISAPI/Event.notification.httpHosts", "set_alarm_server_outside_network_payload")
+        if request.content != payload:
             raise AssertionError("Request content does not match expected payload")
         return httpx.Response(200)
 
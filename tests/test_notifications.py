@@ -2,57 +2,46 @@
 
 import pytest
 from http import HTTPStatus
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant, callback
 from custom_components.hikvision_next.notifications import EventNotificationsView
 from custom_components.hikvision_next.const import HIKVISION_EVENT, RTSP_PORT_FORCED
-from pytest_homeassistant_custom_component.common import MockConfigEntry
-from unittest.mock import MagicMock
-from tests.conftest import load_fixture, TEST_HOST_IP, TEST_CONFIG, TEST_CONFIG_OUTSIDE_NETWORK
+from custom_components.hikvision_next.isapi import AlertInfo
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events
+from tests.conftest import (
+    assert_state,
+    mock_event_notification,
+    setup_bus_event_listener,
+    TEST_CONFIG,
+    TEST_CONFIG_OUTSIDE_NETWORK,
+)
 from homeassistant.const import (
     STATE_ON,
     STATE_OFF
 )
 
-
-def mock_event_notification(file) -> MagicMock:
-    """Mock incoming event notification request."""
-
-    mock_request = MagicMock()
-    mock_request.headers = {
-        'Content-Type': 'application/xml; charset="UTF-8"',
-    }
-    mock_request.remote = TEST_HOST_IP
-    async def read():
-        payload = load_fixture("ISAPI/EventNotificationAlert", file)
-        return payload.encode()
-    mock_request.read = read
-    return mock_request
+NVR_FIELDDETECTION_ENTITY_ID = "binary_sensor.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_2_fielddetection"
 
 
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_nvr_intrusion_detection_alert(
     hass: HomeAssistant, init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming intrusion detection event alert from nvr."""
 
-    entity_id = "binary_sensor.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_2_fielddetection"
-    bus_events = []
-    def bus_event_listener(event: Event) -> None:
-        bus_events.append(event)
-    hass.bus.async_listen(HIKVISION_EVENT, bus_event_listener)
+    @callback
+    def channel_filter(event_data) -> bool:
+        return event_data["channel_id"] == 2
+    bus_events = setup_bus_event_listener(hass, channel_filter)
 
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, NVR_FIELDDETECTION_ENTITY_ID, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("nvr_2_fielddetection")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, NVR_FIELDDETECTION_ENTITY_ID, STATE_ON)
 
-    await hass.async_block_till_done()
     assert len(bus_events) == 1
     data = bus_events[0].data
     assert data["channel_id"] == 2
@@ -63,64 +52,59 @@ async def test_nvr_intrusion_detection_alert(
 @pytest.mark.parametrize("init_integration", ["DS-2CD2386G2-IU"], indirect=True)
 async def test_ipc_intrusion_detection_alert(
     hass: HomeAssistant, init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming intrusion detection event alert from ip camera."""
 
     entity_id = "binary_sensor.ds_2cd2386g2_iu00000000aawrj00000000_1_fielddetection"
 
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, entity_id, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("ipc_1_fielddetection")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-2TD1228-2-QA"], indirect=True)
 async def test_ipc_motion_detection_on_thermometry_channel_alert(
     hass: HomeAssistant, init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming motion detection event alert on thermometry channel from ip multi channel camera."""
 
     entity_id = "binary_sensor.ds_2td1228_2_qa_xxxxxxxxxxxxxxxxxx_2_motiondetection"
 
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, entity_id, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("ipc_thermometry_motiondetection")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-2CD2146G2-ISU"], indirect=True)
 async def test_field_detection_alert(
     hass: HomeAssistant, init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming field detection event with detection target."""
 
     entity_id = "binary_sensor.ds_2cd2146g2_isu00000000aawrg00000000_1_fielddetection"
-    bus_events = []
-    def bus_event_listener(event: Event) -> None:
-        bus_events.append(event)
-    hass.bus.async_listen(HIKVISION_EVENT, bus_event_listener)
 
-    view = EventNotificationsView(hass)
+    @callback
+    def channel_filter(event_data) -> bool:
+        return event_data["channel_id"] == 1
+    bus_events = setup_bus_event_listener(hass, channel_filter)
+
     mock_request = mock_event_notification("fielddetection_human")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
-    await hass.async_block_till_done()
     assert len(bus_events) == 1
     data = bus_events[0].data
     assert data["channel_id"] == 1
@@ -129,13 +113,11 @@ async def test_field_detection_alert(
     assert data["region_id"] == 3
 
     mock_request = mock_event_notification("fielddetection_vehicle")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
-    await hass.async_block_till_done()
     assert len(bus_events) == 2
     data = bus_events[1].data
     assert data["channel_id"] == 1
@@ -144,6 +126,43 @@ async def test_field_detection_alert(
     assert data["region_id"] == 2
 
 
+@pytest.mark.parametrize(
+    "alert_kwargs, expected, forbidden",
+    [
+        (
+            {"detection_target": "human", "region_id": 3},
+            {"event_id": "fielddetection", "detection_target": "human", "region_id": 3},
+            (),
+        ),
+        (
+            {},
+            {"event_id": "fielddetection", "io_port_id": 0},
+            ("detection_target", "region_id"),
+        ),
+    ],
+)
+@pytest.mark.parametrize("init_integration", ["DS-2CD2146G2-ISU"], indirect=True)
+async def test_fire_hass_event(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
+    alert_kwargs: dict,
+    expected: dict,
+    forbidden: tuple[str, ...],
+) -> None:
+    """Test event data fired on the bus with and without detection target."""
+
+    bus_events = async_capture_events(hass, HIKVISION_EVENT)
+    event_view.device = init_integration.runtime_data
+    event_view.fire_hass_event(AlertInfo(channel_id=1, io_port_id=0, event_id="fielddetection", **alert_kwargs))
+
+    assert len(bus_events) == 1
+    data = bus_events[0].data
+    assert data["channel_id"] == 1
+    assert expected.items() <= data.items()
+    assert not data.keys() & set(forbidden)
+
+
 @pytest.mark.parametrize(
     "init_multi_device_integration",
     [
@@ -159,78 +178,61 @@ async def test_field_detection_alert(
 async def test_nvr_and_cam_notification_alert(
     hass: HomeAssistant,
     init_multi_device_integration: list[MockConfigEntry],
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming multiple notifications with 1 NVR in the same network et 3 cameras outside."""
 
     """A NVR IN THE SAME NETWORK without macAddress in notification"""
-    entity_nvr_1_id = "binary_sensor.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_2_fielddetection"
+    entity_nvr_1_id = NVR_FIELDDETECTION_ENTITY_ID
 
     """ANOTHER CAMERAS OUTSIDE THE NETWORK with macAddress in notification"""
     entity_cam_1_id = "binary_sensor.ds_2cd2t46g2_isu_sl00000000aawrg00000000_1_io"
     entity_cam_2_id = "binary_sensor.ds_2cd2346g2_isu_sl00000000aawrj00000000_1_io"
     entity_cam_3_id = "binary_sensor.ds_2cd2t86g2_isu_sl00000000aawrae0000000_1_io"
 
-    bus_events = []
-
-    def bus_event_listener(event: Event) -> None:
-        bus_events.append(event)
-
-    hass.bus.async_listen(HIKVISION_EVENT, bus_event_listener)
+    bus_events = setup_bus_event_listener(hass)
 
-    assert (sensor_cam_1 := hass.states.get(entity_cam_1_id))
-    assert (sensor_cam_2 := hass.states.get(entity_cam_2_id))
-    assert (sensor_cam_3 := hass.states.get(entity_cam_3_id))
-    assert (sensor_nvr_1 := hass.states.get(entity_nvr_1_id))
-    assert sensor_cam_1.state == STATE_OFF
-    assert sensor_cam_2.state == STATE_OFF
-    assert sensor_cam_3.state == STATE_OFF
-    assert sensor_nvr_1.state == STATE_OFF
+    assert_state(hass, entity_cam_1_id, STATE_OFF)
+    assert_state(hass, entity_cam_2_id, STATE_OFF)
+    assert_state(hass, entity_cam_3_id, STATE_OFF)
+    assert_state(hass, entity_nvr_1_id, STATE_OFF)
 
     """NOTIFICATION ON CAM 3 SENSOR"""
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("cam3_DS-2CD2T86G2-ISU_io_notification")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
+    assert len(bus_events) == 1
+    assert {"channel_id": 1, "io_port_id": 1, "event_id": "io"}.items() <= bus_events[-1].data.items()
 
-    assert (sensor_cam_1 := hass.states.get(entity_cam_1_id))
-    assert (sensor_cam_2 := hass.states.get(entity_cam_2_id))
-    assert (sensor_cam_3 := hass.states.get(entity_cam_3_id))
-    assert (sensor_nvr_1 := hass.states.get(entity_nvr_1_id))
-    assert sensor_cam_1.state == STATE_OFF
-    assert sensor_cam_2.state == STATE_OFF
-    assert sensor_cam_3.state == STATE_ON
-    assert sensor_nvr_1.state == STATE_OFF
+    assert_state(hass, entity_cam_1_id, STATE_OFF)
+    assert_state(hass, entity_cam_2_id, STATE_OFF)
+    assert_state(hass, entity_cam_3_id, STATE_ON)
+    assert_state(hass, entity_nvr_1_id, STATE_OFF)
 
     """NOTIFICATION ON CAM 1 SENSOR"""
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("cam1_DS-2CD2T46G2-ISU_io_notification")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
+    assert len(bus_events) == 2
+    assert {"channel_id": 1, "io_port_id": 1, "event_id": "io"}.items() <= bus_events[-1].data.items()
 
-    assert (sensor_cam_1 := hass.states.get(entity_cam_1_id))
-    assert (sensor_cam_2 := hass.states.get(entity_cam_2_id))
-    assert (sensor_cam_3 := hass.states.get(entity_cam_3_id))
-    assert (sensor_nvr_1 := hass.states.get(entity_nvr_1_id))
-    assert sensor_cam_1.state == STATE_ON
-    assert sensor_cam_2.state == STATE_OFF
-    assert sensor_cam_3.state == STATE_ON
-    assert sensor_nvr_1.state == STATE_OFF
+    assert_state(hass, entity_cam_1_id, STATE_ON)
+    assert_state(hass, entity_cam_2_id, STATE_OFF)
+    assert_state(hass, entity_cam_3_id, STATE_ON)
+    assert_state(hass, entity_nvr_1_id, STATE_OFF)
 
     """NOTIFICATION WITHOUT MAC ADDRESS ON NVR"""
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("nvr_2_fielddetection")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
+    assert len(bus_events) == 3
+    assert {"channel_id": 2, "event_id": "fielddetection"}.items() <= bus_events[-1].data.items()
 
 
-    assert (sensor_cam_1 := hass.states.get(entity_cam_1_id))
-    assert (sensor_cam_2 := hass.states.get(entity_cam_2_id))
-    assert (sensor_cam_3 := hass.states.get(entity_cam_3_id))
-    assert (sensor_nvr_1 := hass.states.get(entity_nvr_1_id))
-    assert sensor_cam_1.state == STATE_ON
-    assert sensor_cam_2.state == STATE_OFF
-    assert sensor_cam_3.state == STATE_ON
-    assert sensor_nvr_1.state == STATE_ON
+    assert_state(hass, entity_cam_1_id, STATE_ON)
+    assert_state(hass, entity_cam_2_id, STATE_OFF)
+    assert_state(hass, entity_cam_3_id, STATE_ON)
+    assert_state(hass, entity_nvr_1_id, STATE_ON)
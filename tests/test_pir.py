@@ -10,8 +10,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 import homeassistant.helpers.entity_registry as er
 from custom_components.hikvision_next.hikvision_device import HikvisionDevice
 from custom_components.hikvision_next.notifications import EventNotificationsView
-from tests.test_notifications import mock_event_notification
-from tests.conftest import TEST_HOST
+from tests.conftest import TEST_HOST, assert_state, mock_event_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     SERVICE_TURN_OFF,
@@ -40,20 +39,18 @@ async def test_pir_entities(
 @pytest.mark.parametrize("init_integration", ["DS-2CD2443G0-IW"], indirect=True)
 async def test_pir_alert(
     hass: HomeAssistant, init_integration: MockConfigEntry,
+    event_view: EventNotificationsView,
 ) -> None:
     """Test incoming PIR alarm."""
 
     entity_id = "binary_sensor.ds_2cd2443g0_iw00000000aawre00000000_1_pir"
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_OFF
+    assert_state(hass, entity_id, STATE_OFF)
 
-    view = EventNotificationsView(hass)
     mock_request = mock_event_notification("pir")
-    response = await view.post(mock_request)
+    response = await event_view.post(mock_request)
 
     assert response.status == HTTPStatus.OK
-    assert (sensor := hass.states.get(entity_id))
-    assert sensor.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-2CD2443G0-IW"], indirect=True)
@@ -61,8 +58,7 @@ async def test_pir_switch(hass: HomeAssistant, init_integration: MockConfigEntry
     """Test PIR switch."""
 
     entity_id = "switch.ds_2cd2443g0_iw00000000aawre00000000_1_pir"
-    assert (switch := hass.states.get(entity_id))
-    assert switch.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
     url = f"{TEST_HOST}/ISAPI/WLAlarm/PIR"
     endpoint = respx.put(url)
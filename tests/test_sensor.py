@@ -4,6 +4,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 import homeassistant.helpers.entity_registry as er
+from tests.conftest import assert_state
 
 
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
@@ -20,8 +21,7 @@ async def test_sensor_value(
         ("sensor.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_alarm_server_protocol_type", "HTTP"),
         ("sensor.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_1_hdd1", "OK"),
     ]:
-        assert (sensor := hass.states.get(entity_id))
-        assert sensor.state == state
+        assert_state(hass, entity_id, state)
 
 @pytest.mark.parametrize("init_integration", ["DS-2CD2T86G2-ISU"], indirect=True)
 async def test_sensor_value_outside_network(
@@ -37,8 +37,7 @@ async def test_sensor_value_outside_network(
         ("sensor.ds_2cd2t86g2_isu_sl00000000aawrae0000000_alarm_server_protocol_type", "HTTPS"),
         ("sensor.ds_2cd2t86g2_isu_sl00000000aawrae0000000_1_hdde", "OK"),
     ]:
-        assert (sensor := hass.states.get(entity_id))
-        assert sensor.state == state
+        assert_state(hass, entity_id, state)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-2CD2146G2-ISU", "DS-7608NXI-I2"], indirect=True)
@@ -1,10 +1,14 @@
 """Tests for actions."""
 
+import re
 import pytest
+import voluptuous as vol
 import respx
+import httpx
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.hikvision_next.const import (
+    ACTION_ISAPI_REQUEST,
     ACTION_PTZ_GOTO_PRESET,
     ACTION_PTZ_SET_PATROL,
     ACTION_REBOOT,
@@ -13,16 +17,21 @@ from custom_components.hikvision_next.const import (
 )
 from tests.conftest import TEST_HOST
 
+TIME_RESPONSE = httpx.Response(200, content=b"<Time>\r\n</Time>")
+REBOOT_RESPONSE = httpx.Response(200, content=b"<ResponseStatus/>")
+PATROL_STATUS_RE = re.compile(rb"<(enabled|status)>([^<]*)</\1>")
+REBOOT_URL = f"{TEST_HOST}/ISAPI/System/reboot"
+PTZ_GOTO_PRESET_URL = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/{{channel}}/presets/{{preset}}/goto"
+PTZ_PATROL_STATUS_URL = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/{{channel}}/patrols/{{patrol}}/status"
+
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_reboot_action(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending reboot request on reboot action."""
 
     mock_config_entry = init_integration
 
-    url = f"{TEST_HOST}/ISAPI/System/reboot"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(REBOOT_URL).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -34,7 +43,109 @@ async def test_reboot_action(hass: HomeAssistant, init_integration: MockConfigEn
     assert endpoint.called
 
 
-@respx.mock
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_isapi_request_action_default_method(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test that a single ISAPI request without method is sent as GET."""
+
+    mock_config_entry = init_integration
+
+    time_endpoint = respx.get(f"{TEST_HOST}/ISAPI/System/time").mock(return_value=TIME_RESPONSE)
+    post_endpoint = respx.post(f"{TEST_HOST}/ISAPI/System/time").respond()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        ACTION_ISAPI_REQUEST,
+        {ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id, "path": "System/time"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert time_endpoint.called
+    assert not post_endpoint.called
+    assert response == {"data": "<Time>\n</Time>"}
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_isapi_request_batch_action(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test sending list of ISAPI requests in one action call."""
+
+    mock_config_entry = init_integration
+
+    time_endpoint = respx.get(f"{TEST_HOST}/ISAPI/System/time").mock(return_value=TIME_RESPONSE)
+    reboot_endpoint = respx.put(REBOOT_URL).mock(return_value=REBOOT_RESPONSE)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        ACTION_ISAPI_REQUEST,
+        {
+            ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id,
+            "requests": [
+                {"method": "GET", "path": "/System/time"},
+                {"method": "PUT", "path": "System/reboot"},
+            ],
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert time_endpoint.called
+    assert reboot_endpoint.called
+    assert response == {"data": [{"response": "<Time>\n</Time>"}, {"response": "<ResponseStatus/>"}]}
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+async def test_isapi_request_batch_action_item_error(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
+    """Test that a request failing to connect does not discard responses of other requests."""
+
+    mock_config_entry = init_integration
+
+    time_endpoint = respx.get(f"{TEST_HOST}/ISAPI/System/time").mock(return_value=TIME_RESPONSE)
+    respx.get(f"{TEST_HOST}/ISAPI/System/status").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        ACTION_ISAPI_REQUEST,
+        {
+            ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id,
+            "requests": [
+                {"method": "GET", "path": "System/status"},
+                {"method": "GET", "path": "System/time"},
+            ],
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert time_endpoint.called
+    assert response == {"data": [{"error": "ConnectError: Connection refused"}, {"response": "<Time>\n</Time>"}]}
+
+
+@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"path": "System/time", "requests": [{"method": "GET", "path": "System/time"}]},
+    ],
+    ids=["no_path_nor_requests", "path_and_requests"],
+)
+async def test_isapi_request_action_schema(
+    hass: HomeAssistant, init_integration: MockConfigEntry, data: dict
+) -> None:
+    """Test that isapi_request requires exactly one of path and requests."""
+
+    mock_config_entry = init_integration
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            ACTION_ISAPI_REQUEST,
+            {ATTR_CONFIG_ENTRY_ID: mock_config_entry.entry_id, **data},
+            blocking=True,
+            return_response=True,
+        )
+
+
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_ptz_goto_preset_action(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ go to preset request."""
@@ -42,8 +153,7 @@ async def test_ptz_goto_preset_action(hass: HomeAssistant, init_integration: Moc
     mock_config_entry = init_integration
 
     # Test going to preset 1 on channel 1
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/1/presets/1/goto"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_GOTO_PRESET_URL.format(channel=1, preset=1)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -59,7 +169,6 @@ async def test_ptz_goto_preset_action(hass: HomeAssistant, init_integration: Moc
     assert endpoint.called
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_ptz_goto_preset_action_different_preset(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ go to preset request with different preset number."""
@@ -67,8 +176,7 @@ async def test_ptz_goto_preset_action_different_preset(hass: HomeAssistant, init
     mock_config_entry = init_integration
 
     # Test going to preset 5 on channel 2
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/2/presets/5/goto"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_GOTO_PRESET_URL.format(channel=2, preset=5)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -84,7 +192,6 @@ async def test_ptz_goto_preset_action_different_preset(hass: HomeAssistant, init
     assert endpoint.called
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_ptz_set_patrol_start_action(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ start patrol request."""
@@ -92,8 +199,7 @@ async def test_ptz_set_patrol_start_action(hass: HomeAssistant, init_integration
     mock_config_entry = init_integration
 
     # Test starting patrol 1 on channel 1
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/1/patrols/1/status"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_PATROL_STATUS_URL.format(channel=1, patrol=1)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -109,12 +215,10 @@ async def test_ptz_set_patrol_start_action(hass: HomeAssistant, init_integration
 
     assert endpoint.called
     # Verify the request body contains start status
-    request_content = endpoint.calls[0].request.content.decode("utf-8")
-    assert "<enabled>true</enabled>" in request_content
-    assert "<status>start</status>" in request_content
+    request_fields = dict(PATROL_STATUS_RE.findall(endpoint.calls[0].request.content))
+    assert request_fields == {b"enabled": b"true", b"status": b"start"}
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_ptz_set_patrol_stop_action(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ stop patrol request."""
@@ -122,8 +226,7 @@ async def test_ptz_set_patrol_stop_action(hass: HomeAssistant, init_integration:
     mock_config_entry = init_integration
 
     # Test stopping patrol 1 on channel 1
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/1/patrols/1/status"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_PATROL_STATUS_URL.format(channel=1, patrol=1)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -139,12 +242,10 @@ async def test_ptz_set_patrol_stop_action(hass: HomeAssistant, init_integration:
 
     assert endpoint.called
     # Verify the request body contains stop status
-    request_content = endpoint.calls[0].request.content.decode("utf-8")
-    assert "<enabled>false</enabled>" in request_content
-    assert "<status>stop</status>" in request_content
+    request_fields = dict(PATROL_STATUS_RE.findall(endpoint.calls[0].request.content))
+    assert request_fields == {b"enabled": b"false", b"status": b"stop"}
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
 async def test_ptz_set_patrol_different_channel_patrol(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ patrol request with different channel and patrol numbers."""
@@ -152,8 +253,7 @@ async def test_ptz_set_patrol_different_channel_patrol(hass: HomeAssistant, init
     mock_config_entry = init_integration
 
     # Test starting patrol 3 on channel 2
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/2/patrols/3/status"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_PATROL_STATUS_URL.format(channel=2, patrol=3)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -170,7 +270,6 @@ async def test_ptz_set_patrol_different_channel_patrol(hass: HomeAssistant, init
     assert endpoint.called
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-2SE4C425MWG-E-26"], indirect=True)
 async def test_ptz_goto_preset_on_ptz_camera(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ go to preset request on actual PTZ camera (DS-2SE4C425MWG-E-26)."""
@@ -178,8 +277,7 @@ async def test_ptz_goto_preset_on_ptz_camera(hass: HomeAssistant, init_integrati
     mock_config_entry = init_integration
 
     # Test going to preset 1 on channel 1 (PTZ channel)
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/1/presets/1/goto"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_GOTO_PRESET_URL.format(channel=1, preset=1)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -195,7 +293,6 @@ async def test_ptz_goto_preset_on_ptz_camera(hass: HomeAssistant, init_integrati
     assert endpoint.called
 
 
-@respx.mock
 @pytest.mark.parametrize("init_integration", ["DS-2SE4C425MWG-E-26"], indirect=True)
 async def test_ptz_set_patrol_on_ptz_camera(hass: HomeAssistant, init_integration: MockConfigEntry) -> None:
     """Test sending PTZ patrol request on actual PTZ camera (DS-2SE4C425MWG-E-26)."""
@@ -203,8 +300,7 @@ async def test_ptz_set_patrol_on_ptz_camera(hass: HomeAssistant, init_integratio
     mock_config_entry = init_integration
 
     # Test starting patrol 1 on channel 1 (PTZ channel)
-    url = f"{TEST_HOST}/ISAPI/PTZCtrl/channels/1/patrols/1/status"
-    endpoint = respx.put(url).respond()
+    endpoint = respx.put(PTZ_PATROL_STATUS_URL.format(channel=1, patrol=1)).respond()
 
     await hass.services.async_call(
         DOMAIN,
@@ -219,6 +315,5 @@ async def test_ptz_set_patrol_on_ptz_camera(hass: HomeAssistant, init_integratio
     )
 
     assert endpoint.called
-    request_content = endpoint.calls[0].request.content.decode("utf-8")
-    assert "<enabled>true</enabled>" in request_content
-    assert "<status>start</status>" in request_content
+    request_fields = dict(PATROL_STATUS_RE.findall(endpoint.calls[0].request.content))
+    assert request_fields == {b"enabled": b"true", b"status": b"start"}
@@ -3,14 +3,27 @@
 import respx
 import pytest
 import httpx
+from unittest.mock import patch
 from homeassistant.core import HomeAssistant
 from custom_components.hikvision_next.isapi.const import EVENT_IO
 from custom_components.hikvision_next.hikvision_device import HikvisionDevice
-from tests.conftest import TEST_HOST
+from tests.conftest import TEST_HOST, assert_state
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 import homeassistant.helpers.entity_registry as er
-from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON, STATE_ON, STATE_OFF
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON, STATE_ON, STATE_OFF, Platform
+
+VIDEOLOSS_DISABLED_PAYLOAD = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<VideoLoss version="2.0" xmlns="http://www.isapi.org/ver20/XMLSchema"><enabled>false</enabled></VideoLoss>'
+)
+
+
+@pytest.fixture(autouse=True)
+def switch_platform_only():
+    """Set up only the switch platform, entities of other platforms are not tested here."""
+    with patch("custom_components.hikvision_next.PLATFORMS", [Platform.SWITCH]):
+        yield
 
 
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
@@ -36,8 +49,7 @@ async def test_event_switch_state(
         ("switch.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_1_alarm_output", STATE_OFF),
         ("switch.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_holiday_mode", STATE_OFF),
     ]:
-        assert (switch := hass.states.get(entity_id))
-        assert switch.state == state
+        assert_state(hass, entity_id, state)
 
     entity_registry = er.async_get(hass)
     for entity_id in [
@@ -62,8 +74,7 @@ async def test_event_switch_state_of_a_camera(
         ("switch.ds_2cd2t86g2_isu_sl00000000aawrae0000000_1_io", STATE_OFF),
         ("switch.ds_2cd2t86g2_isu_sl00000000aawrae0000000_1_alarm_output", STATE_OFF)
     ]:
-        assert (switch := hass.states.get(entity_id))
-        assert switch.state == state
+        assert_state(hass, entity_id, state)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2"], indirect=True)
@@ -71,12 +82,10 @@ async def test_event_switch_payload(hass: HomeAssistant, init_integration: MockC
     """Test event switch."""
 
     entity_id = "switch.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_1_videoloss"
-    assert (switch := hass.states.get(entity_id))
-    assert switch.state == STATE_ON
+    assert_state(hass, entity_id, STATE_ON)
 
     def update_side_effect(request, route):
-        payload = '<?xml version="1.0" encoding="utf-8"?>\n<VideoLoss version="2.0" xmlns="http://www.isapi.org/ver20/XMLSchema"><enabled>false</enabled></VideoLoss>'
-        if request.content.decode("utf-8") != payload:
+        if request.content != VIDEOLOSS_DISABLED_PAYLOAD:
             raise AssertionError("Request content does not match expected payload")
         return httpx.Response(200)
 
@@ -111,8 +120,7 @@ async def test_alarm_output_switch(
 
     port_no = 1
     entity_id = f"switch.ds_7608nxi_i0_0p_s0000000000ccrrj00000000wcvu_{port_no}_alarm_output"
-    assert (switch := hass.states.get(entity_id))
-    assert switch.state == STATE_OFF
+    assert_state(hass, entity_id, STATE_OFF)
 
     url = f"{TEST_HOST}/ISAPI/System/IO/outputs/{port_no}/trigger"
     endpoint = respx.put(url)
@@ -141,49 +149,34 @@ async def test_alarm_input_switch_state_url(hass: HomeAssistant, init_integratio
                 assert e.url == f"ContentMgmt/IOProxy/inputs/{e.io_port_id}"
 
 
-@pytest.mark.parametrize("init_integration", ["DS-7608NXI-I2", "DS-7616NI-K2"], indirect=True)
-async def test_nvr_event_switch_state_url(
-    hass: HomeAssistant,
-    init_integration: MockConfigEntry,
-) -> None:
-    """Test NVR event switch."""
-
-    device: HikvisionDevice = init_integration.runtime_data
-    for e in device.cameras[0].events_info:
-        if e.id == "motiondetection":
-            assert e.url == f"ContentMgmt/InputProxy/channels/{e.channel_id}/video/motionDetection"
-        if e.id == "fielddetection":
-            assert e.url == f"Smart/FieldDetection/{e.channel_id}"
-
-
-@pytest.mark.parametrize("init_integration", ["iDS-7204HUHI-M1"], indirect=True)
-async def test_dvr_event_switch_state_url(
-    hass: HomeAssistant,
-    init_integration: MockConfigEntry,
-) -> None:
-    """Test DVR event switch."""
-
-    device: HikvisionDevice = init_integration.runtime_data
-    for e in device.cameras[0].events_info:
-        if e.id == "motiondetection":
-            assert e.url == f"System/Video/inputs/channels/{e.channel_id}/motionDetection"
-        if e.id == "fielddetection":
-            assert e.url == f"Smart/FieldDetection/{e.channel_id}"
-
-
-@pytest.mark.parametrize("init_integration", ["DS-2CD2386G2-IU"], indirect=True)
-async def test_ipc_event_switch_state_url(
+NVR_EVENT_STATE_URLS = {
+    "motiondetection": "ContentMgmt/InputProxy/channels/{}/video/motionDetection",
+    "fielddetection": "Smart/FieldDetection/{}",
+}
+DEVICE_EVENT_STATE_URLS = {
+    "motiondetection": "System/Video/inputs/channels/{}/motionDetection",
+    "fielddetection": "Smart/FieldDetection/{}",
+}
+EVENT_STATE_URLS = {
+    "DS-7608NXI-I2": NVR_EVENT_STATE_URLS,
+    "DS-7616NI-K2": NVR_EVENT_STATE_URLS,
+    "iDS-7204HUHI-M1": DEVICE_EVENT_STATE_URLS,
+    "DS-2CD2386G2-IU": DEVICE_EVENT_STATE_URLS,
+}
+
+
+@pytest.mark.parametrize("init_integration", list(EVENT_STATE_URLS), indirect=True)
+async def test_event_switch_state_url(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
 ) -> None:
-    """Test IPC event switch."""
+    """Test NVR, DVR and IPC event switch state url."""
 
     device: HikvisionDevice = init_integration.runtime_data
+    state_urls = EVENT_STATE_URLS[init_integration.title]
     for e in device.cameras[0].events_info:
-        if e.id == "motiondetection":
-            assert e.url == f"System/Video/inputs/channels/{e.channel_id}/motionDetection"
-        if e.id == "fielddetection":
-            assert e.url == f"Smart/FieldDetection/{e.channel_id}"
+        if url := state_urls.get(e.id):
+            assert e.url == url.format(e.channel_id)
 
 
 @pytest.mark.parametrize("init_integration", ["DS-2SE4C425MWG-E-26"], indirect=True)
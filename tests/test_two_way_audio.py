@@ -14,7 +14,7 @@ from custom_components.hikvision_next.const import (
 )
 from custom_components.hikvision_next.isapi import TwoWayAudioChannelInfo
 from custom_components.hikvision_next.hikvision_device import HikvisionDevice
-from tests.conftest import TEST_HOST, mock_endpoint
+from tests.conftest import TEST_HOST, mock_endpoint, status_response
 
 
 @respx.mock
@@ -238,7 +238,7 @@ async def test_start_two_way_audio_failure(mock_isapi):
     isapi = mock_isapi
 
     url = f"{TEST_HOST}/ISAPI/System/TwoWayAudio/channels/1/open"
-    respx.put(url).respond(status_code=500)
+    respx.put(url).mock(return_value=status_response(500))
 
     result = await isapi.start_two_way_audio(channel_id=1)
 
@@ -265,7 +265,7 @@ async def test_stop_two_way_audio_failure(mock_isapi):
     isapi = mock_isapi
 
     url = f"{TEST_HOST}/ISAPI/System/TwoWayAudio/channels/1/close"
-    respx.put(url).respond(status_code=500)
+    respx.put(url).mock(return_value=status_response(500))
 
     result = await isapi.stop_two_way_audio(channel_id=1)
 
@@ -317,7 +317,7 @@ async def test_send_two_way_audio_data_failure(mock_isapi):
     audio_data = b"\x00\x01\x02\x03"
 
     url = f"{TEST_HOST}/ISAPI/System/TwoWayAudio/channels/1/audioData"
-    respx.put(url).respond(status_code=500)
+    respx.put(url).mock(return_value=status_response(500))
 
     result = await isapi.send_two_way_audio_data(audio_data, channel_id=1)
 